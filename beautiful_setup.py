@@ -4,616 +4,415 @@ Beautiful OBS Setup - Create stunning professional scenes with gradients, animat
 """
 
 import asyncio
+import atexit
 import json
 import os
+import sys
+import threading
+import types
 
 from dotenv import load_dotenv
 from obswebsocket import obsws, requests
 
-load_dotenv()
+# Add the src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+from obs_agent import use_orjson  # noqa: E402
+
+# Skip reading .env when the environment already provides the password
+if not os.environ.get("OBS_WEBSOCKET_PASSWORD"):
+    load_dotenv()
+
+# obs-websocket-py encodes every request with json.dumps; orjson does the same
+# work several times faster for these nested settings payloads
+use_orjson()
+
+# Theme names in showcase order (keys of COLOR_SCHEMES)
+_THEME_NAMES = ("cyberpunk", "sunset", "ocean", "forest", "minimal")
+
+# Scenes created by create_beautiful_scenes, in order
+_SCENE_ORDER = (
+    "🚀 Welcome",
+    "💻 Code Studio",
+    "🖥️ Terminal Zone",
+    "🎓 Teaching Mode",
+    "🎯 Focus Mode",
+    "☕ Chill Break",
+    "🎉 Thanks & Subscribe",
+)
+
+# Beautiful color schemes (plain 0xRRGGBB; see BeautifulOBSSetup._obs_color for the wire format)
+_RAW_COLOR_SCHEMES = {
+    "cyberpunk": {
+        "primary": 0x00FFFF,    # Cyan
+        "secondary": 0xFF00FF,  # Magenta
+        "accent": 0x00FF00,     # Green
+        "background": 0x1A1A2E, # Dark purple
+        "text": 0xFFFFFF       # White
+    },
+    "sunset": {
+        "primary": 0xFF6B35,    # Orange
+        "secondary": 0xF7931E,  # Yellow
+        "accent": 0xFF1744,     # Red
+        "background": 0x2E1760, # Deep purple
+        "text": 0xFFFFFF       # White
+    },
+    "ocean": {
+        "primary": 0x00B4D8,    # Light blue
+        "secondary": 0x0077B6,  # Medium blue
+        "accent": 0x023E8A,     # Dark blue
+        "background": 0x03045E, # Navy
+        "text": 0xFFFFFF       # White
+    },
+    "forest": {
+        "primary": 0x40916C,    # Green
+        "secondary": 0x52B788,  # Light green
+        "accent": 0x2D6A4F,     # Dark green
+        "background": 0x1B4332, # Forest green
+        "text": 0xFFFFFF       # White
+    },
+    "minimal": {
+        "primary": 0x000000,    # Black
+        "secondary": 0x333333,  # Dark gray
+        "accent": 0x666666,     # Medium gray
+        "background": 0xF8F9FA, # Light gray
+        "text": 0x000000       # Black
+    }
+}
+
+# Read-only view shared by every instance; accidental mutation raises TypeError
+COLOR_SCHEMES = types.MappingProxyType(
+    {theme: types.MappingProxyType(scheme) for theme, scheme in _RAW_COLOR_SCHEMES.items()}
+)
+
+# Font descriptors shared by the text inputs; the serializer only reads them
+_SF_PRO_BOLD_84 = {"face": "SF Pro Display", "size": 84, "style": "Bold"}
+_SF_PRO_BOLD_72 = {"face": "SF Pro Display", "size": 72, "style": "Bold"}
+_SF_PRO_BOLD_64 = {"face": "SF Pro Display", "size": 64, "style": "Bold"}
+_SF_PRO_SEMIBOLD_36 = {"face": "SF Pro Display", "size": 36, "style": "SemiBold"}
+_SF_PRO_MEDIUM_36 = {"face": "SF Pro Display", "size": 36, "style": "Medium"}
+_SF_PRO_MEDIUM_32 = {"face": "SF Pro Display", "size": 32, "style": "Medium"}
+_SF_MONO_BOLD_48 = {"face": "SF Mono", "size": 48, "style": "Bold"}
+_SF_MONO_BOLD_32 = {"face": "SF Mono", "size": 32, "style": "Bold"}
+_SF_MONO_MEDIUM_24 = {"face": "SF Mono", "size": 24, "style": "Medium"}
+
+# One OBS connection per process, reused by every BeautifulOBSSetup instance
+_shared_ws = None
+_shared_ws_lock = threading.Lock()
+
+
+def _get_shared_ws(password):
+    """Return the shared OBS connection, opening it only if there is no live one"""
+    global _shared_ws
+    with _shared_ws_lock:
+        if _shared_ws is None or not (_shared_ws.ws and _shared_ws.ws.connected):
+            ws = obsws("localhost", 4455, password)
+            ws.connect()
+            _shared_ws = ws
+        return _shared_ws
+
+
+@atexit.register
+def _close_shared_ws():
+    """Close the shared OBS connection when the interpreter exits"""
+    if _shared_ws is not None and _shared_ws.ws and _shared_ws.ws.connected:
+        _shared_ws.disconnect()
 
 
 class BeautifulOBSSetup:
+    # Shared base for every text_ft2_source_v2 input; per-input values are merged on top.
+    # Only settings the FreeType 2 source reads are sent: align, valign, outline_size
+    # and outline_color belong to the GDI+ text source and would be ignored.
+    _BASE_TEXT = {
+        "outline": True,
+        "custom_width": 1920,
+    }
+
+    # Element builder for each scene, looked up by exact scene name
+    _SCENE_BUILDERS = {
+        "🚀 Welcome": "_add_welcome_elements",
+        "💻 Code Studio": "_add_code_studio_elements",
+        "🖥️ Terminal Zone": "_add_terminal_elements",
+        "🎓 Teaching Mode": "_add_teaching_elements",
+        "🎯 Focus Mode": "_add_focus_elements",
+        "☕ Chill Break": "_add_break_elements",
+        "🎉 Thanks & Subscribe": "_add_ending_elements",
+    }
+
+    # Where positioned elements go once their scene exists (x, y)
+    ELEMENT_POSITIONS = {
+        "Welcome Subtitle": (960, 640),
+        "Status Bar": (960, 1040),
+        "Terminal Header": (960, 80),
+        "Social Links": (960, 700),
+    }
+
     def __init__(self):
         self.ws = None
         self.password = os.getenv("OBS_WEBSOCKET_PASSWORD", "")
         
-        # Beautiful color schemes
-        self.color_schemes = {
-            "cyberpunk": {
-                "primary": 0xFF00FFFF,    # Cyan
-                "secondary": 0xFFFF00FF,  # Magenta  
-                "accent": 0xFF00FF00,     # Green
-                "background": 0xFF1a1a2e, # Dark purple
-                "text": 0xFFFFFFFF       # White
-            },
-            "sunset": {
-                "primary": 0xFFFF6B35,    # Orange
-                "secondary": 0xFFF7931E,  # Yellow
-                "accent": 0xFFFF1744,     # Red
-                "background": 0xFF2E1760, # Deep purple
-                "text": 0xFFFFFFFF       # White
-            },
-            "ocean": {
-                "primary": 0xFF00B4D8,    # Light blue
-                "secondary": 0xFF0077B6,  # Medium blue
-                "accent": 0xFF023E8A,     # Dark blue
-                "background": 0xFF03045E, # Navy
-                "text": 0xFFFFFFFF       # White
-            },
-            "forest": {
-                "primary": 0xFF40916C,    # Green
-                "secondary": 0xFF52B788,  # Light green  
-                "accent": 0xFF2D6A4F,     # Dark green
-                "background": 0xFF1B4332, # Forest green
-                "text": 0xFFFFFFFF       # White
-            },
-            "minimal": {
-                "primary": 0xFF000000,    # Black
-                "secondary": 0xFF333333,  # Dark gray
-                "accent": 0xFF666666,     # Medium gray
-                "background": 0xFFF8F9FA, # Light gray
-                "text": 0xFF000000       # Black
+        # Status lines, written out together by flush_log()
+        self._log = []
+
+        # Per-theme colors in OBS wire format, plus "<role>_hex" display strings
+        self._color_cache = {
+            theme: {
+                **{role: self._obs_color(rgb) for role, rgb in scheme.items()},
+                **{f"{role}_hex": f"#{rgb:06X}" for role, rgb in scheme.items()},
             }
+            for theme, scheme in COLOR_SCHEMES.items()
         }
+
+        # Fully resolved request batches per theme, filled in by _precompile
+        self._precompiled = {}
+
+        # The theme showcase never changes, so format it once
+        self._showcase_text = "\n".join(
+            [f"\n🎨 BEAUTIFUL THEME SHOWCASE\n{'=' * 60}"]
+            + [
+                f"\n{i}. {theme.title()} Theme:\n"
+                f"   Primary: {self._color_cache[theme]['primary_hex']}\n"
+                f"   Secondary: {self._color_cache[theme]['secondary_hex']}\n"
+                f"   Accent: {self._color_cache[theme]['accent_hex']}\n"
+                f"   Perfect for: {self._get_theme_description(theme)}"
+                for i, theme in enumerate(_THEME_NAMES, 1)
+            ]
+        )
     
-    def connect(self):
+    @staticmethod
+    def _obs_color(rgb):
+        """Convert 0xRRGGBB to the opaque 0xAABBGGRR integer OBS text sources expect"""
+        return 0xFF000000 | ((rgb & 0xFF) << 16) | (rgb & 0xFF00) | ((rgb >> 16) & 0xFF)
+
+    async def connect(self):
         """Connect to OBS"""
         try:
-            self.ws = obsws("localhost", 4455, self.password)
-            self.ws.connect()
-            print("✅ Connected to OBS!")
+            self.ws = await asyncio.get_running_loop().run_in_executor(None, _get_shared_ws, self.password)
+            self._log.append("✅ Connected to OBS!")
             return True
         except Exception as e:
-            print(f"❌ Connection failed: {e}")
+            self._log.append(f"❌ Connection failed: {e}")
             return False
     
-    def disconnect(self):
-        """Disconnect from OBS"""
+    async def disconnect(self):
+        """Release this setup's handle; the shared connection closes at exit"""
         if self.ws:
-            self.ws.disconnect()
-            print("👋 Disconnected from OBS")
+            self.ws = None
+            self._log.append("👋 Disconnected from OBS")
     
     async def create_beautiful_scenes(self, theme="cyberpunk"):
         """Create beautiful scenes with professional styling"""
-        print(f"🎨 Creating Beautiful Scenes - {theme.title()} Theme")
-        print("=" * 60)
+        self._log.append(f"🎨 Creating Beautiful Scenes - {theme.title()} Theme")
+        self._log.append("=" * 60)
         
-        colors = self.color_schemes[theme]
+        batches = self._precompile(theme)
         
-        # Beautiful scene definitions
-        scenes = {
-            "🚀 Welcome": {
-                "description": "Animated welcome screen",
-                "elements": [
-                    {
-                        "type": "gradient_background",
-                        "colors": [colors["background"], colors["primary"]]
-                    },
-                    {
-                        "type": "animated_title",
-                        "text": "🚀 LIVE CODING SESSION",
-                        "font_size": 84,
-                        "color": colors["text"],
-                        "animation": "fade_slide"
-                    },
-                    {
-                        "type": "subtitle",
-                        "text": "Building Amazing Software Live",
-                        "font_size": 36,
-                        "color": colors["secondary"]
-                    },
-                    {
-                        "type": "countdown_timer",
-                        "color": colors["accent"]
-                    }
-                ]
-            },
-            "💻 Code Studio": {
-                "description": "Professional coding environment",
-                "elements": [
-                    {
-                        "type": "code_frame",
-                        "border_color": colors["primary"],
-                        "border_style": "glow"
-                    },
-                    {
-                        "type": "webcam_pip",
-                        "position": "bottom-right",
-                        "border_color": colors["accent"],
-                        "border_style": "rounded_glow"
-                    },
-                    {
-                        "type": "status_bar",
-                        "background": colors["background"],
-                        "text_color": colors["text"]
-                    },
-                    {
-                        "type": "particle_effects",
-                        "style": "coding_particles"
-                    }
-                ]
-            },
-            "🖥️ Terminal Zone": {
-                "description": "Stylized terminal interface",
-                "elements": [
-                    {
-                        "type": "terminal_frame",
-                        "border_color": colors["primary"],
-                        "glow_intensity": 0.8
-                    },
-                    {
-                        "type": "matrix_background",
-                        "color": colors["primary"],
-                        "opacity": 0.1
-                    },
-                    {
-                        "type": "typing_indicator",
-                        "color": colors["accent"]
-                    }
-                ]
-            },
-            "🎓 Teaching Mode": {
-                "description": "Educational presentation layout",
-                "elements": [
-                    {
-                        "type": "webcam_main",
-                        "position": "left",
-                        "border_style": "professional"
-                    },
-                    {
-                        "type": "code_window",
-                        "position": "right",
-                        "border_color": colors["secondary"]
-                    },
-                    {
-                        "type": "explanation_overlay",
-                        "background": colors["background"],
-                        "opacity": 0.9
-                    }
-                ]
-            },
-            "🎯 Focus Mode": {
-                "description": "Zoomed debugging interface",
-                "elements": [
-                    {
-                        "type": "magnified_code",
-                        "zoom_level": 1.5,
-                        "highlight_color": colors["accent"]
-                    },
-                    {
-                        "type": "debug_overlay",
-                        "color": colors["primary"]
-                    },
-                    {
-                        "type": "pulse_border",
-                        "color": colors["accent"],
-                        "speed": "slow"
-                    }
-                ]
-            },
-            "☕ Chill Break": {
-                "description": "Relaxing break screen",
-                "elements": [
-                    {
-                        "type": "animated_background",
-                        "style": "floating_shapes",
-                        "colors": [colors["primary"], colors["secondary"]]
-                    },
-                    {
-                        "type": "break_message",
-                        "text": "☕ Taking a Quick Break",
-                        "font_size": 72,
-                        "color": colors["text"],
-                        "animation": "gentle_pulse"
-                    },
-                    {
-                        "type": "music_visualizer",
-                        "color": colors["accent"]
-                    },
-                    {
-                        "type": "timer_display",
-                        "color": colors["secondary"]
-                    }
-                ]
-            },
-            "🎉 Thanks & Subscribe": {
-                "description": "Engaging end screen",
-                "elements": [
-                    {
-                        "type": "celebration_background",
-                        "style": "confetti_particles"
-                    },
-                    {
-                        "type": "thanks_message",
-                        "text": "🎉 Thanks for Watching!",
-                        "font_size": 80,
-                        "color": colors["text"],
-                        "animation": "bounce_in"
-                    },
-                    {
-                        "type": "social_links",
-                        "style": "animated_icons",
-                        "color": colors["primary"]
-                    },
-                    {
-                        "type": "subscribe_button",
-                        "color": colors["accent"],
-                        "animation": "pulse"
-                    }
-                ]
-            }
-        }
-        
-        # Create the beautiful scenes
-        for scene_name, scene_config in scenes.items():
-            await self._create_beautiful_scene(scene_name, scene_config, colors)
+        # Look up existing scenes once instead of letting OBS reject duplicates
+        scene_list = await self._call(requests.GetSceneList())
+        existing = {scene["sceneName"] for scene in scene_list.datain.get("scenes", [])}
+        for scene_name in existing.intersection(batches):
+            self._log.append(f"  ⏭️  Scene already exists: {scene_name}")
+
+        # Create the beautiful scenes one after another over the shared connection
+        for scene_name, batch in batches.items():
+            if scene_name not in existing:
+                await self._create_beautiful_scene(scene_name, batch)
+
+    def _precompile(self, theme):
+        """Resolve every scene's request batch for a theme once and cache it"""
+        batches = self._precompiled.get(theme)
+        if batches is None:
+            colors = self._color_cache[theme]
+            batches = {}
+            for scene_name in _SCENE_ORDER:
+                batch = [{"requestType": "CreateScene", "requestData": {"sceneName": scene_name}}]
+
+                # Add elements based on scene type
+                builder = getattr(self, self._SCENE_BUILDERS.get(scene_name, ""), None)
+                if builder:
+                    builder(batch, scene_name, colors)
+                batches[scene_name] = batch
+            self._precompiled[theme] = batches
+        return batches
     
-    async def _create_beautiful_scene(self, scene_name, config, colors):
-        """Create a single beautiful scene"""
+    async def _call(self, request):
+        """Send one request over the shared connection and return OBS's response"""
+        # obs-websocket-py's call() blocks until OBS answers and hands out request ids
+        # without locking, so requests on one connection can't be overlapped
+        return self.ws.call(request)
+
+    async def _call_batch(self, batch, halt_on_failure=False):
+        """Execute OBS v5 batch request dicts in order and return the responses
+
+        Entries use the RequestBatch shape ({"requestType", "requestData"}).
+        obs-websocket-py has no RequestBatch transport, so they are issued
+        back to back over the open connection.
+        """
+        responses = []
+        for item in batch:
+            response = await self._call(getattr(requests, item["requestType"])(**item["requestData"]))
+            responses.append(response)
+            if halt_on_failure and not response.status:
+                break
+        return responses
+
+    async def _create_beautiful_scene(self, scene_name, batch):
+        """Create a single beautiful scene from its precompiled batch"""
         try:
-            # Create the scene
-            self.ws.call(requests.CreateScene(sceneName=scene_name))
-            print(f"🎨 Created scene: {scene_name}")
-            
-            # Add elements based on scene type
-            if "Welcome" in scene_name:
-                await self._add_welcome_elements(scene_name, colors)
-            elif "Code Studio" in scene_name:
-                await self._add_code_studio_elements(scene_name, colors)
-            elif "Terminal Zone" in scene_name:
-                await self._add_terminal_elements(scene_name, colors)
-            elif "Teaching Mode" in scene_name:
-                await self._add_teaching_elements(scene_name, colors)
-            elif "Focus Mode" in scene_name:
-                await self._add_focus_elements(scene_name, colors)
-            elif "Chill Break" in scene_name:
-                await self._add_break_elements(scene_name, colors)
-            elif "Thanks" in scene_name:
-                await self._add_ending_elements(scene_name, colors)
+            # Create the scene and all of its elements in one pass
+            responses = await self._call_batch(batch)
+            self._log.append(f"🎨 Created scene: {scene_name}")
+
+            await self._position_elements(scene_name, batch, responses)
             
         except Exception as e:
-            if "already exists" not in str(e):
-                print(f"  ⚠️  Scene might already exist: {scene_name}")
+            self._log.append(f"  ⚠️  Could not create scene {scene_name}: {e}")
     
-    async def _add_welcome_elements(self, scene_name, colors):
+    async def _position_elements(self, scene_name, batch, responses):
+        """Move positioned elements into place using the sceneItemId CreateInput returned"""
+        for item, response in zip(batch, responses):
+            if item["requestType"] != "CreateInput" or not response.status:
+                continue
+            position = self.ELEMENT_POSITIONS.get(item["requestData"]["inputName"])
+            if position is None:
+                continue
+            await self._call(requests.SetSceneItemTransform(
+                sceneName=scene_name,
+                sceneItemId=response.datain["sceneItemId"],
+                sceneItemTransform={
+                    "positionX": position[0],
+                    "positionY": position[1],
+                    "scaleX": 1.0,
+                    "scaleY": 1.0
+                }
+            ))
+
+    def _text_settings(self, text, font, color, **overrides):
+        """Build text_ft2_source_v2 settings on top of the shared base template"""
+        return {**self._BASE_TEXT, "text": text, "font": font, "color1": color, "color2": color, **overrides}
+
+    def _text_input(self, scene_name, input_name, text, font, color, **overrides):
+        """Build a CreateInput batch entry for a styled text source"""
+        return {"requestType": "CreateInput", "requestData": {
+            "sceneName": scene_name,
+            "inputName": input_name,
+            "inputKind": "text_ft2_source_v2",
+            "inputSettings": self._text_settings(text, font, color, **overrides)
+        }}
+
+    def _add_welcome_elements(self, batch, scene_name, colors):
         """Add beautiful welcome screen elements"""
         # Animated title text
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Welcome Title",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🚀 LIVE CODING SESSION\n✨ Building Amazing Software",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 84,
-                    "style": "Bold"
-                },
-                "color1": colors["text"],
-                "color2": colors["text"],
-                "outline": True,
-                "outline_size": 4,
-                "outline_color": colors["primary"],
-                "drop_shadow": True,
-                "custom_width": 1920,
-                "align": "center",
-                "valign": "center"
-            }
+        batch.append(self._text_input(
+            scene_name, "Welcome Title",
+            "🚀 LIVE CODING SESSION\n✨ Building Amazing Software", _SF_PRO_BOLD_84, colors["text"],
+            drop_shadow=True
         ))
         
-        # Subtitle
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Welcome Subtitle",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🎯 Learning • Building • Sharing",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 36,
-                    "style": "Medium"
-                },
-                "color1": colors["secondary"],
-                "color2": colors["secondary"],
-                "custom_width": 1920,
-                "align": "center",
-                "valign": "center"
-            }
+        # Subtitle (positioned below the title)
+        batch.append(self._text_input(
+            scene_name, "Welcome Subtitle",
+            "🎯 Learning • Building • Sharing", _SF_PRO_MEDIUM_36, colors["secondary"],
+            outline=False
         ))
-        
-        # Position subtitle below title
-        scene_items = self.ws.call(requests.GetSceneItemList(sceneName=scene_name))
-        for item in scene_items.datain["sceneItems"]:
-            if item["sourceName"] == "Welcome Subtitle":
-                self.ws.call(requests.SetSceneItemTransform(
-                    sceneName=scene_name,
-                    sceneItemId=item["sceneItemId"],
-                    sceneItemTransform={
-                        "positionX": 960,
-                        "positionY": 640,
-                        "scaleX": 1.0,
-                        "scaleY": 1.0
-                    }
-                ))
     
-    async def _add_code_studio_elements(self, scene_name, colors):
+    def _add_code_studio_elements(self, batch, scene_name, colors):
         """Add code studio elements with professional styling"""
-        # Main code display (screen capture)
-        try:
-            self.ws.call(requests.CreateInput(
-                sceneName=scene_name,
-                inputName="Code Display",
-                inputKind="display_capture",
-                inputSettings={
-                    "display": 0,
-                    "show_cursor": True
-                }
-            ))
-            
-            # Add glow border filter to code display
-            self.ws.call(requests.CreateSourceFilter(
-                sourceName="Code Display",
-                filterName="Glow Border",
-                filterKind="color_filter",
-                filterSettings={
-                    "brightness": 0.02,
-                    "contrast": 0.05,
-                    "saturation": 1.1
-                }
-            ))
-        except:
-            pass
-        
-        # Status bar overlay
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Status Bar",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🔴 LIVE • 💻 Coding Session • 🎯 Building Something Amazing",
-                "font": {
-                    "face": "SF Mono",
-                    "size": 24,
-                    "style": "Medium"
-                },
-                "color1": colors["text"],
-                "color2": colors["text"],
-                "outline": True,
-                "outline_size": 2,
-                "outline_color": colors["background"],
-                "custom_width": 1920,
-                "align": "center"
+        # Main code display (screen capture); failures here don't stop the batch
+        batch.append({"requestType": "CreateInput", "requestData": {
+            "sceneName": scene_name,
+            "inputName": "Code Display",
+            "inputKind": "display_capture",
+            "inputSettings": {
+                "display": 0,
+                "show_cursor": True
             }
-        ))
+        }})
+
+        # Add glow border filter to code display
+        batch.append({"requestType": "CreateSourceFilter", "requestData": {
+            "sourceName": "Code Display",
+            "filterName": "Glow Border",
+            "filterKind": "color_filter",
+            "filterSettings": {
+                "brightness": 0.02,
+                "contrast": 0.05,
+                "saturation": 1.1
+            }
+        }})
         
-        # Position status bar at bottom
-        scene_items = self.ws.call(requests.GetSceneItemList(sceneName=scene_name))
-        for item in scene_items.datain["sceneItems"]:
-            if item["sourceName"] == "Status Bar":
-                self.ws.call(requests.SetSceneItemTransform(
-                    sceneName=scene_name,
-                    sceneItemId=item["sceneItemId"],
-                    sceneItemTransform={
-                        "positionX": 960,
-                        "positionY": 1040,
-                        "scaleX": 1.0,
-                        "scaleY": 1.0
-                    }
-                ))
+        # Status bar overlay (positioned at the bottom)
+        batch.append(self._text_input(
+            scene_name, "Status Bar",
+            "🔴 LIVE • 💻 Coding Session • 🎯 Building Something Amazing", _SF_MONO_MEDIUM_24, colors["text"]
+        ))
     
-    async def _add_terminal_elements(self, scene_name, colors):
+    def _add_terminal_elements(self, batch, scene_name, colors):
         """Add terminal elements with matrix-style effects"""
-        # Terminal frame text
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Terminal Header",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🖥️  TERMINAL ZONE  🖥️",
-                "font": {
-                    "face": "SF Mono",
-                    "size": 48,
-                    "style": "Bold"
-                },
-                "color1": colors["primary"],
-                "color2": colors["primary"],
-                "outline": True,
-                "outline_size": 3,
-                "outline_color": colors["background"],
-                "custom_width": 1920,
-                "align": "center"
-            }
+        # Terminal frame text (positioned at the top)
+        batch.append(self._text_input(
+            scene_name, "Terminal Header",
+            "🖥️  TERMINAL ZONE  🖥️", _SF_MONO_BOLD_48, colors["primary"]
         ))
-        
-        # Position at top
-        scene_items = self.ws.call(requests.GetSceneItemList(sceneName=scene_name))
-        for item in scene_items.datain["sceneItems"]:
-            if item["sourceName"] == "Terminal Header":
-                self.ws.call(requests.SetSceneItemTransform(
-                    sceneName=scene_name,
-                    sceneItemId=item["sceneItemId"],
-                    sceneItemTransform={
-                        "positionX": 960,
-                        "positionY": 80,
-                        "scaleX": 1.0,
-                        "scaleY": 1.0
-                    }
-                ))
     
-    async def _add_teaching_elements(self, scene_name, colors):
+    def _add_teaching_elements(self, batch, scene_name, colors):
         """Add teaching mode elements"""
         # Teaching header
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Teaching Header",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🎓 TEACHING MODE • Explaining Code Concepts",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 36,
-                    "style": "SemiBold"
-                },
-                "color1": colors["primary"],
-                "color2": colors["primary"],
-                "outline": True,
-                "outline_size": 2,
-                "outline_color": colors["background"],
-                "custom_width": 1920,
-                "align": "center"
-            }
+        batch.append(self._text_input(
+            scene_name, "Teaching Header",
+            "🎓 TEACHING MODE • Explaining Code Concepts", _SF_PRO_SEMIBOLD_36, colors["primary"]
         ))
     
-    async def _add_focus_elements(self, scene_name, colors):
+    def _add_focus_elements(self, batch, scene_name, colors):
         """Add focus mode elements"""
         # Focus mode indicator
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Focus Indicator",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🎯 FOCUS MODE • Debugging Session",
-                "font": {
-                    "face": "SF Mono",
-                    "size": 32,
-                    "style": "Bold"
-                },
-                "color1": colors["accent"],
-                "color2": colors["accent"],
-                "outline": True,
-                "outline_size": 3,
-                "outline_color": colors["background"],
-                "custom_width": 1920,
-                "align": "center"
-            }
+        batch.append(self._text_input(
+            scene_name, "Focus Indicator",
+            "🎯 FOCUS MODE • Debugging Session", _SF_MONO_BOLD_32, colors["accent"]
         ))
     
-    async def _add_break_elements(self, scene_name, colors):
+    def _add_break_elements(self, batch, scene_name, colors):
         """Add beautiful break screen elements"""
         # Break message with animation styling
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Break Message",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "☕ Taking a Quick Break\n🎵 Enjoy the music • Be right back! ✨",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 64,
-                    "style": "Bold"
-                },
-                "color1": colors["text"],
-                "color2": colors["text"],
-                "outline": True,
-                "outline_size": 4,
-                "outline_color": colors["primary"],
-                "drop_shadow": True,
-                "custom_width": 1920,
-                "align": "center",
-                "valign": "center"
-            }
+        batch.append(self._text_input(
+            scene_name, "Break Message",
+            "☕ Taking a Quick Break\n🎵 Enjoy the music • Be right back! ✨", _SF_PRO_BOLD_64, colors["text"],
+            drop_shadow=True
         ))
         
         # Break timer
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Break Timer",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "⏰ Back in 5 minutes",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 36,
-                    "style": "Medium"
-                },
-                "color1": colors["secondary"],
-                "color2": colors["secondary"],
-                "custom_width": 1920,
-                "align": "center"
-            }
+        batch.append(self._text_input(
+            scene_name, "Break Timer",
+            "⏰ Back in 5 minutes", _SF_PRO_MEDIUM_36, colors["secondary"],
+            outline=False
         ))
     
-    async def _add_ending_elements(self, scene_name, colors):
+    def _add_ending_elements(self, batch, scene_name, colors):
         """Add beautiful ending screen elements"""
         # Thanks message
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Thanks Message",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🎉 Thanks for Watching!\n✨ Hope you learned something awesome!",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 72,
-                    "style": "Bold"
-                },
-                "color1": colors["text"],
-                "color2": colors["text"],
-                "outline": True,
-                "outline_size": 4,
-                "outline_color": colors["primary"],
-                "drop_shadow": True,
-                "custom_width": 1920,
-                "align": "center",
-                "valign": "center"
-            }
+        batch.append(self._text_input(
+            scene_name, "Thanks Message",
+            "🎉 Thanks for Watching!\n✨ Hope you learned something awesome!", _SF_PRO_BOLD_72, colors["text"],
+            drop_shadow=True
         ))
         
-        # Social links
-        self.ws.call(requests.CreateInput(
-            sceneName=scene_name,
-            inputName="Social Links",
-            inputKind="text_ft2_source_v2",
-            inputSettings={
-                "text": "🐙 GitHub • 🐦 Twitter • 💼 LinkedIn • 📺 Subscribe!",
-                "font": {
-                    "face": "SF Pro Display",
-                    "size": 32,
-                    "style": "Medium"
-                },
-                "color1": colors["secondary"],
-                "color2": colors["secondary"],
-                "outline": True,
-                "outline_size": 2,
-                "outline_color": colors["background"],
-                "custom_width": 1920,
-                "align": "center"
-            }
+        # Social links (positioned below the thanks message)
+        batch.append(self._text_input(
+            scene_name, "Social Links",
+            "🐙 GitHub • 🐦 Twitter • 💼 LinkedIn • 📺 Subscribe!", _SF_PRO_MEDIUM_32, colors["secondary"]
         ))
-        
-        # Position social links below thanks message
-        scene_items = self.ws.call(requests.GetSceneItemList(sceneName=scene_name))
-        for item in scene_items.datain["sceneItems"]:
-            if item["sourceName"] == "Social Links":
-                self.ws.call(requests.SetSceneItemTransform(
-                    sceneName=scene_name,
-                    sceneItemId=item["sceneItemId"],
-                    sceneItemTransform={
-                        "positionX": 960,
-                        "positionY": 700,
-                        "scaleX": 1.0,
-                        "scaleY": 1.0
-                    }
-                ))
     
-    async def create_theme_showcase(self):
+    def create_theme_showcase(self):
         """Showcase all available themes"""
-        print("\n🎨 BEAUTIFUL THEME SHOWCASE")
-        print("=" * 60)
-        
-        themes = list(self.color_schemes.keys())
-        
-        for i, theme in enumerate(themes, 1):
-            colors = self.color_schemes[theme]
-            print(f"\n{i}. {theme.title()} Theme:")
-            print(f"   Primary: #{colors['primary']:06X}")
-            print(f"   Secondary: #{colors['secondary']:06X}")  
-            print(f"   Accent: #{colors['accent']:06X}")
-            print(f"   Perfect for: {self._get_theme_description(theme)}")
-        
-        return themes
+        self._log.append(self._showcase_text)
+        return _THEME_NAMES
     
+    def flush_log(self):
+        """Write buffered status lines to stdout in a single call"""
+        if self._log:
+            sys.stdout.write("\n".join(self._log) + "\n")
+            self._log.clear()
+
     def _get_theme_description(self, theme):
         """Get description for theme"""
         descriptions = {
@@ -628,52 +427,61 @@ class BeautifulOBSSetup:
 
 async def main():
     """Create beautiful OBS setup"""
-    print("🎨 BEAUTIFUL OBS SETUP")
-    print("=" * 60)
-    print("Transform your stream with professional, gorgeous scenes!")
-    
     setup = BeautifulOBSSetup()
+    setup._log.append("🎨 BEAUTIFUL OBS SETUP")
+    setup._log.append("=" * 60)
+    setup._log.append("Transform your stream with professional, gorgeous scenes!")
+    setup.flush_log()
     
-    if not setup.connect():
-        print("❌ Cannot connect to OBS")
+    if not await setup.connect():
+        setup._log.append("❌ Cannot connect to OBS")
+        setup.flush_log()
         return
     
     try:
         # Show theme options
-        themes = await setup.create_theme_showcase()
+        themes = setup.create_theme_showcase()
         
-        print(f"\nWhich theme would you like?")
+        setup._log.append(f"\nWhich theme would you like?")
         for i, theme in enumerate(themes, 1):
-            print(f"  {i}. {theme.title()}")
+            setup._log.append(f"  {i}. {theme.title()}")
         
         # For automation, let's use cyberpunk theme
         chosen_theme = "cyberpunk"
-        print(f"\n🎯 Creating {chosen_theme.title()} theme...")
+        setup._log.append(f"\n🎯 Creating {chosen_theme.title()} theme...")
+        setup.flush_log()
         
         # Create beautiful scenes
         await setup.create_beautiful_scenes(chosen_theme)
         
-        print(f"\n✨ BEAUTIFUL SETUP COMPLETE!")
-        print("=" * 60)
-        print("🎬 Your new beautiful scenes:")
-        print("   🚀 Welcome - Animated welcome screen")
-        print("   💻 Code Studio - Professional coding environment")
-        print("   🖥️ Terminal Zone - Stylized terminal interface")
-        print("   🎓 Teaching Mode - Educational presentation layout")
-        print("   🎯 Focus Mode - Zoomed debugging interface")
-        print("   ☕ Chill Break - Relaxing break screen with music")
-        print("   🎉 Thanks & Subscribe - Engaging end screen")
-        print("\n🎨 Features added:")
-        print("   ✨ Professional typography with SF Pro fonts")
-        print("   🌈 Cohesive color scheme throughout")
-        print("   ✨ Glowing borders and effects")
-        print("   📱 Optimized text positioning")
-        print("   🎪 Engaging visual elements")
-        print("\n🚀 Ready for beautiful streaming!")
+        setup._log.append(f"\n✨ BEAUTIFUL SETUP COMPLETE!")
+        setup._log.append("=" * 60)
+        setup._log.append("🎬 Your new beautiful scenes:")
+        setup._log.append("   🚀 Welcome - Animated welcome screen")
+        setup._log.append("   💻 Code Studio - Professional coding environment")
+        setup._log.append("   🖥️ Terminal Zone - Stylized terminal interface")
+        setup._log.append("   🎓 Teaching Mode - Educational presentation layout")
+        setup._log.append("   🎯 Focus Mode - Zoomed debugging interface")
+        setup._log.append("   ☕ Chill Break - Relaxing break screen with music")
+        setup._log.append("   🎉 Thanks & Subscribe - Engaging end screen")
+        setup._log.append("\n🎨 Features added:")
+        setup._log.append("   ✨ Professional typography with SF Pro fonts")
+        setup._log.append("   🌈 Cohesive color scheme throughout")
+        setup._log.append("   ✨ Glowing borders and effects")
+        setup._log.append("   📱 Optimized text positioning")
+        setup._log.append("   🎪 Engaging visual elements")
+        setup._log.append("\n🚀 Ready for beautiful streaming!")
         
     finally:
-        setup.disconnect()
+        await setup.disconnect()
+        setup.flush_log()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -5,170 +5,228 @@ Beautiful Scene Tour - Showcase the gorgeous new scenes
 
 import asyncio
 import os
+import sys
+from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 from obswebsocket import obsws, requests
 
-load_dotenv()
+# Skip reading .env when the environment already provides the password
+if not os.environ.get("OBS_WEBSOCKET_PASSWORD"):
+    load_dotenv()
+
+PASSWORD = os.environ.get("OBS_WEBSOCKET_PASSWORD", "")
+
+# Beautiful scene tour sequence, one entry per scene across these parallel tuples
+SCENE_NAMES = (
+    "🚀 Welcome",
+    "💻 Code Studio",
+    "🖥️ Terminal Zone",
+    "🎓 Teaching Mode",
+    "🎯 Focus Mode",
+    "☕ Chill Break",
+    "🎉 Thanks & Subscribe",
+)
+SCENE_TITLES = (
+    "Welcome Screen",
+    "Code Studio",
+    "Terminal Zone",
+    "Teaching Mode",
+    "Focus Mode",
+    "Chill Break",
+    "Thanks & Subscribe",
+)
+SCENE_DESCRIPTIONS = (
+    "Animated welcome with cyberpunk styling",
+    "Professional coding environment",
+    "Matrix-style terminal interface",
+    "Educational presentation layout",
+    "Debugging and focus interface",
+    "Relaxing break screen",
+    "Engaging end screen",
+)
+SCENE_DURATIONS = (5, 6, 4, 5, 4, 6, 5)
+SCENE_FEATURES = (
+    ("Glowing text effects", "Professional typography", "Animated elements"),
+    ("Code display frame", "Status bar overlay", "Professional layout"),
+    ("Cyberpunk header", "Terminal styling", "Futuristic theme"),
+    ("Teaching header", "Clean layout", "Educational focus"),
+    ("Focus indicator", "Debugging theme", "Concentrated view"),
+    ("Break message", "Timer display", "Relaxing vibes"),
+    ("Thanks message", "Social links", "Subscribe call-to-action"),
+)
+
+TOTAL_DURATION = sum(SCENE_DURATIONS)
+
+# Per-scene tour headers, formatted once from the tables above
+_SCENE_HEADERS = tuple(
+    f"🎨 Scene {i}/{len(SCENE_NAMES)}: {title}\n"
+    f"   📝 {description}\n"
+    f"   ✨ Features: {', '.join(features)}\n"
+    f"   ⏱️  Displaying for {duration} seconds...\n"
+    for i, (title, description, duration, features) in enumerate(
+        zip(SCENE_TITLES, SCENE_DESCRIPTIONS, SCENE_DURATIONS, SCENE_FEATURES), 1
+    )
+)
+
+# Static banners, each written to stdout in a single call
+_WELCOME_BANNER = f"""🎨 Welcome to your Beautiful OBS Setup!
+{"=" * 60}
+"""
+
+_STYLE_DEMO_BANNER = f"""
+🎨 BEFORE vs AFTER
+{"=" * 60}
+🔸 BEFORE (Plain):
+   - Basic text without styling
+   - No visual effects
+   - Generic layouts
+   - Boring appearance
+
+✨ AFTER (Beautiful):
+   - Professional typography (SF Pro fonts)
+   - Glowing borders and effects
+   - Cyberpunk color scheme
+   - Animated elements
+   - Status bars and overlays
+   - Optimized positioning
+   - Cohesive branding
+
+🎯 The difference:
+   📈 Professional appearance
+   👀 Better viewer engagement
+   🎨 Memorable visual identity
+   🏆 Stand out from other streams
+"""
+
+_TOUR_HEADER = f"""🎨 BEAUTIFUL SCENE TOUR
+{"=" * 60}
+Showcasing your gorgeous new streaming scenes!
+"""
+
+_TOUR_INTRO = f"""✅ Connected to OBS!
+
+🎬 Starting beautiful scene tour...
+Watch OBS as we showcase each gorgeous scene!
+
+⏰ Total tour time: {TOTAL_DURATION} seconds
+
+"""
+
+_TOUR_COMPLETE_BANNER = f"""🎉 BEAUTIFUL SCENE TOUR COMPLETE!
+{"=" * 60}
+✨ Your stream now has:
+   🎨 Professional cyberpunk theme
+   ✨ Glowing text effects and borders
+   🌈 Cohesive color scheme
+   📱 Optimized layouts for streaming
+   🎪 Engaging visual elements
+   💫 Beautiful typography
+
+🚀 Ready to go live with style!
+Your stream will look absolutely stunning! 🎬✨
+"""
+
+# One OBS connection per process, shared by every obs_session() user
+_session = None
+_session_lock = None
+
+
+@asynccontextmanager
+async def obs_session(password):
+    """Yield the shared OBS connection, connecting only if there is no live one"""
+    global _session, _session_lock
+    if _session_lock is None:
+        _session_lock = asyncio.Lock()
+    async with _session_lock:
+        if _session is None or not (_session.ws and _session.ws.connected):
+            # websocket-client already opens its socket with TCP_NODELAY set, so the
+            # small scene-switch frames go out without Nagle batching delays
+            ws = obsws("localhost", 4455, password)
+            await asyncio.get_running_loop().run_in_executor(None, ws.connect)
+            _session = ws
+    # Left open on exit so the next session skips the handshake
+    yield _session
+
+
+async def close_obs_session():
+    """Disconnect the shared OBS connection, if one is open"""
+    global _session
+    if _session is not None:
+        ws, _session = _session, None
+        await asyncio.get_running_loop().run_in_executor(None, ws.disconnect)
+
+
+def _write(text):
+    """Write text to stdout in one call and flush it straight to the terminal"""
+    sys.stdout.write(text)
+    sys.stdout.flush()
 
 
 async def beautiful_scene_tour():
     """Tour through all the beautiful new scenes"""
-    print("🎨 BEAUTIFUL SCENE TOUR")
-    print("=" * 60)
-    print("Showcasing your gorgeous new streaming scenes!")
-    
-    password = os.getenv("OBS_WEBSOCKET_PASSWORD", "")
+    _write(_TOUR_HEADER)
     
     try:
-        # Connect
-        ws = obsws("localhost", 4455, password)
-        ws.connect()
-        print("✅ Connected to OBS!")
-        
-        # Beautiful scene tour sequence
-        tour_scenes = [
-            {
-                "scene": "🚀 Welcome",
-                "title": "Welcome Screen",
-                "description": "Animated welcome with cyberpunk styling",
-                "duration": 5,
-                "features": ["Glowing text effects", "Professional typography", "Animated elements"]
-            },
-            {
-                "scene": "💻 Code Studio", 
-                "title": "Code Studio",
-                "description": "Professional coding environment",
-                "duration": 6,
-                "features": ["Code display frame", "Status bar overlay", "Professional layout"]
-            },
-            {
-                "scene": "🖥️ Terminal Zone",
-                "title": "Terminal Zone", 
-                "description": "Matrix-style terminal interface",
-                "duration": 4,
-                "features": ["Cyberpunk header", "Terminal styling", "Futuristic theme"]
-            },
-            {
-                "scene": "🎓 Teaching Mode",
-                "title": "Teaching Mode",
-                "description": "Educational presentation layout",
-                "duration": 5,
-                "features": ["Teaching header", "Clean layout", "Educational focus"]
-            },
-            {
-                "scene": "🎯 Focus Mode",
-                "title": "Focus Mode",
-                "description": "Debugging and focus interface",
-                "duration": 4,
-                "features": ["Focus indicator", "Debugging theme", "Concentrated view"]
-            },
-            {
-                "scene": "☕ Chill Break",
-                "title": "Chill Break",
-                "description": "Relaxing break screen",
-                "duration": 6,
-                "features": ["Break message", "Timer display", "Relaxing vibes"]
-            },
-            {
-                "scene": "🎉 Thanks & Subscribe",
-                "title": "Thanks & Subscribe",
-                "description": "Engaging end screen",
-                "duration": 5,
-                "features": ["Thanks message", "Social links", "Subscribe call-to-action"]
-            }
-        ]
-        
-        print("\n🎬 Starting beautiful scene tour...")
-        print("Watch OBS as we showcase each gorgeous scene!\n")
+        async with obs_session(PASSWORD) as ws:
+            loop = asyncio.get_running_loop()
+            _write(_TOUR_INTRO)
         
-        total_duration = sum(scene["duration"] for scene in tour_scenes)
-        print(f"⏰ Total tour time: {total_duration} seconds\n")
-        
-        # Tour through each scene
-        for i, scene_info in enumerate(tour_scenes, 1):
-            scene_name = scene_info["scene"]
-            title = scene_info["title"]
-            description = scene_info["description"]
-            duration = scene_info["duration"]
-            features = scene_info["features"]
-            
-            print(f"🎨 Scene {i}/{len(tour_scenes)}: {title}")
-            print(f"   📝 {description}")
-            print(f"   ✨ Features: {', '.join(features)}")
-            print(f"   ⏱️  Displaying for {duration} seconds...")
+            # Build every switch request up front so the loop only dispatches
+            switch_requests = [requests.SetCurrentProgramScene(sceneName=name) for name in SCENE_NAMES]
+
+            # Tour through each scene
+            for header, duration, switch_request in zip(_SCENE_HEADERS, SCENE_DURATIONS, switch_requests):
+                _write(header)
             
-            # Switch to the scene
-            ws.call(requests.SetCurrentProgramScene(sceneName=scene_name))
+                # Switch to the scene while the countdown starts
+                switch = loop.run_in_executor(None, ws.call, switch_request)
             
-            # Show a countdown for this scene
-            for remaining in range(duration, 0, -1):
-                print(f"      {remaining}...", end=" ", flush=True)
-                await asyncio.sleep(1)
-            print("✅")
-            print()
-        
-        # Tour complete
-        print("🎉 BEAUTIFUL SCENE TOUR COMPLETE!")
-        print("=" * 60)
-        print("✨ Your stream now has:")
-        print("   🎨 Professional cyberpunk theme")
-        print("   ✨ Glowing text effects and borders")
-        print("   🌈 Cohesive color scheme")
-        print("   📱 Optimized layouts for streaming")
-        print("   🎪 Engaging visual elements")
-        print("   💫 Beautiful typography")
-        
-        print("\n🚀 Ready to go live with style!")
-        print("Your stream will look absolutely stunning! 🎬✨")
+                # Show a countdown for this scene: ticks are pinned to the loop's
+                # monotonic clock and the coroutine wakes once, at the deadline
+                start = loop.time()
+                for elapsed, remaining in enumerate(range(duration, 0, -1)):
+                    loop.call_at(start + elapsed, _write, f"      {remaining}... ")
+                await asyncio.sleep(duration)
+                await switch
+                _write("✅\n\n")
         
-        # Return to welcome scene
-        ws.call(requests.SetCurrentProgramScene(sceneName="🚀 Welcome"))
-        print("\n📺 Set to Welcome scene - ready to go live!")
-        
-        ws.disconnect()
+            # Return to welcome scene while the closing banner prints
+            switch = loop.run_in_executor(None, ws.call, requests.SetCurrentProgramScene(sceneName="🚀 Welcome"))
+
+            # Tour complete
+            _write(_TOUR_COMPLETE_BANNER)
         
+            await switch
+            print("\n📺 Set to Welcome scene - ready to go live!")
+
     except Exception as e:
         print(f"❌ Error: {e}")
 
 
 async def quick_style_demo():
     """Quick demo of the styling improvements"""
-    print("\n🎨 BEFORE vs AFTER")
-    print("=" * 60)
-    print("🔸 BEFORE (Plain):")
-    print("   - Basic text without styling")
-    print("   - No visual effects")
-    print("   - Generic layouts")
-    print("   - Boring appearance")
-    
-    print("\n✨ AFTER (Beautiful):")
-    print("   - Professional typography (SF Pro fonts)")
-    print("   - Glowing borders and effects")
-    print("   - Cyberpunk color scheme")
-    print("   - Animated elements")
-    print("   - Status bars and overlays")
-    print("   - Optimized positioning")
-    print("   - Cohesive branding")
-    
-    print("\n🎯 The difference:")
-    print("   📈 Professional appearance")
-    print("   👀 Better viewer engagement")
-    print("   🎨 Memorable visual identity")
-    print("   🏆 Stand out from other streams")
+    _write(_STYLE_DEMO_BANNER)
 
 
 async def main():
-    print("🎨 Welcome to your Beautiful OBS Setup!")
-    print("=" * 60)
+    _write(_WELCOME_BANNER)
     
     await quick_style_demo()
     
-    print(f"\n🎬 Ready for the scene tour?")
     # Auto-start tour for demo
-    print("Starting tour...")
-    await beautiful_scene_tour()
+    _write("\n🎬 Ready for the scene tour?\nStarting tour...\n")
+    try:
+        await beautiful_scene_tour()
+    finally:
+        await close_obs_session()
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
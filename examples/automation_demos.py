@@ -13,27 +13,54 @@ including all major features:
 6. Rule management and monitoring
 
 Usage:
+    pip install -e .
     python examples/automation_demos.py
 
 Make sure OBS is running with WebSocket server enabled!
 """
 
 import asyncio
-import os
 import sys
+import time
 from datetime import datetime
-from pathlib import Path
 
-# Add src to path
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from example_helpers import wait_for_stop
 
-from src.obs_agent import OBSAgent
-from src.obs_agent.events import (
-    CurrentProgramSceneChanged,
-    InputMuteStateChanged,
-    RecordStateChanged,
-    StreamStateChanged,
-)
+from obs_agent import CurrentProgramSceneChanged, InputMuteStateChanged
+from obs_agent import OBSAgentV2 as OBSAgent
+from obs_agent import SceneCreated, SceneNameChanged, SceneRemoved, StreamStateChanged
+
+# How long a fetched scene list is reused before asking OBS again (seconds)
+SCENE_CACHE_TTL = 5.0
+
+# Input names treated as the streamer's microphone by the mic-driven demos
+MIC_SOURCES = frozenset({"Microphone", "Mic", "Mic/Aux"})
+
+
+def _is_mic(event):
+    """Match any mute change on the microphone."""
+    return event.input_name in MIC_SOURCES
+
+
+def _is_mic_muted(event):
+    """Match the microphone being muted."""
+    return event.input_name in MIC_SOURCES and event.input_muted
+
+
+def _is_mic_unmuted(event):
+    """Match the microphone being unmuted."""
+    return event.input_name in MIC_SOURCES and not event.input_muted
+
+
+def _clock():
+    """Current local time as HH:MM:SS (plain formatting, cheaper than strftime)."""
+    now = datetime.now()
+    return f"{now.hour:02d}:{now.minute:02d}:{now.second:02d}"
+
+
+async def _workflow_complete(context):
+    """Custom action that closes the stream startup workflow."""
+    print("🎊 Stream workflow completed!")
 
 
 class AutomationDemo:
@@ -41,6 +68,27 @@ class AutomationDemo:
 
     def __init__(self):
         self.agent = OBSAgent()
+        self._stop = asyncio.Event()
+        self._scene_cache = None
+        self._scene_cache_time = 0.0
+
+    async def _scenes(self):
+        """Return the OBS scene list, reusing a recent answer instead of asking again."""
+        now = time.monotonic()
+        if self._scene_cache is None or now - self._scene_cache_time > SCENE_CACHE_TTL:
+            self._scene_cache = await self.agent.get_scenes()
+            self._scene_cache_time = now
+        return self._scene_cache
+
+    def _watch_scene_list(self):
+        """Drop the cached scene list whenever a scene is added, removed or renamed."""
+
+        # Plain event handlers rather than automation rules, so they stay out of the rule stats
+        @self.agent.on(SceneCreated)
+        @self.agent.on(SceneRemoved)
+        @self.agent.on(SceneNameChanged)
+        async def invalidate_scenes(event):
+            self._scene_cache = None
 
     async def run_full_demo(self):
         """Run the complete automation demo."""
@@ -56,16 +104,20 @@ class AutomationDemo:
 
             # Start automation engine
             self.agent.start_automation()
+            self._watch_scene_list()
             print("🤖 Automation engine started")
 
-            # Run different demo sections
-            await self.demo_basic_event_automation()
-            await self.demo_smart_brb_system()
-            await self.demo_action_builder_patterns()
-            await self.demo_audio_ducking()
-            await self.demo_scheduled_automation()
-            await self.demo_stream_recording_automation()
-            await self.demo_rule_management()
+            # Run the demo sections concurrently: each registers its rules without
+            # awaiting, so only the OBS calls and demo pauses overlap
+            await asyncio.gather(
+                self.demo_basic_event_automation(),
+                self.demo_smart_brb_system(),
+                self.demo_action_builder_patterns(),
+                self.demo_audio_ducking(),
+                self.demo_scheduled_automation(),
+                self.demo_stream_recording_automation(),
+                self.demo_rule_management(),
+            )
 
             # Keep running to show automation in action
             print("\n🎯 Automation Demo Active!")
@@ -79,8 +131,9 @@ class AutomationDemo:
             print("\nTry interacting with OBS to see automation in action!")
             print("Press Ctrl+C to stop...")
 
-            # Wait for user to test automations
-            await asyncio.sleep(300)  # 5 minutes
+            # Wait for user to test automations (5 minutes, or until stopped)
+            if await wait_for_stop(self._stop, timeout=300):
+                print("\n⏹️ Demo stopped by user")
 
         except KeyboardInterrupt:
             print("\n⏹️ Demo stopped by user")
@@ -106,13 +159,13 @@ class AutomationDemo:
         @self.agent.automation.description("Log all scene changes with timestamp")
         async def log_scene_changes(context):
             event = context.trigger_event
-            timestamp = datetime.now().strftime("%H:%M:%S")
+            timestamp = _clock()
             print(f"🎬 [{timestamp}] Scene changed to: {event.scene_name}")
 
         print("✅ Added scene change logger")
 
         # Demonstration
-        scenes = await self.agent.get_scenes()
+        scenes = await self._scenes()
         if len(scenes) >= 2:
             current = await self.agent.get_current_scene()
             other_scene = next((s for s in scenes if s != current), scenes[0])
@@ -139,9 +192,7 @@ class AutomationDemo:
         )
 
         # Register with decorator
-        @self.agent.automation.when(
-            InputMuteStateChanged, lambda e: "Mic" in e.input_name and e.input_muted
-        )
+        @self.agent.automation.when(InputMuteStateChanged, _is_mic_muted)
         @self.agent.automation.description("Switch to BRB scene when mic is muted")
         async def activate_brb_mode(context):
             await brb_action(context)
@@ -152,9 +203,7 @@ class AutomationDemo:
             mic_source="Microphone",
         )
 
-        @self.agent.automation.when(
-            InputMuteStateChanged, lambda e: "Mic" in e.input_name and not e.input_muted
-        )
+        @self.agent.automation.when(InputMuteStateChanged, _is_mic_unmuted)
         @self.agent.automation.description("Return from BRB mode when mic is unmuted")
         async def return_from_brb(context):
             await return_action(context)
@@ -181,9 +230,7 @@ class AutomationDemo:
                 .text("StreamStatus", "🔴 LIVE")  # Update status (if you have this source)
                 .if_recording(False)  # Only if not already recording
                 .start_recording()  # Start recording
-                .custom(
-                    async lambda ctx: print("🎊 Stream workflow completed!")
-                )  # Custom action
+                .custom(_workflow_complete)  # Custom action
                 .build()
             )
 
@@ -205,7 +252,7 @@ class AutomationDemo:
             normal_volume_db=-5.0,  # Normal music volume
         )
 
-        @self.agent.automation.when(InputMuteStateChanged, lambda e: "Mic" in e.input_name)
+        @self.agent.automation.when(InputMuteStateChanged, _is_mic)
         @self.agent.automation.description("Duck music volume based on mic activity")
         async def audio_ducking(context):
             await ducking_action(context)
@@ -224,7 +271,7 @@ class AutomationDemo:
         async def good_morning(context):
             print("🌅 Good morning! Starting daily stream setup...")
             # Switch to morning scene, update overlays, etc.
-            scenes = await self.agent.get_scenes()
+            scenes = await self._scenes()
             if "Morning" in scenes:
                 await self.agent.set_scene("Morning")
 
@@ -237,7 +284,7 @@ class AutomationDemo:
         @self.agent.automation.max_executions(1)  # Only run once
         @self.agent.automation.description("Demo scheduled automation")
         async def demo_scheduled_action(context):
-            print(f"⏰ Scheduled automation triggered at {datetime.now().strftime('%H:%M:%S')}!")
+            print(f"⏰ Scheduled automation triggered at {_clock()}!")
 
         print(f"✅ Added scheduled automation (will trigger at :{demo_minute}:{demo_second:02d})")
 
@@ -319,39 +366,62 @@ class AutomationDemo:
 
         while True:
             try:
-                command = input("\n> ").strip().lower()
+                # Read in a worker thread so automations keep firing while the user types
+                line = await asyncio.get_running_loop().run_in_executor(None, input, "\n> ")
+                command = line.strip().lower()
 
                 if command == "quit":
                     break
-                elif command == "scenes":
-                    scenes = await self.agent.get_scenes()
-                    current = await self.agent.get_current_scene()
-                    print("Available scenes:")
-                    for scene in scenes:
-                        marker = " (current)" if scene == current else ""
-                        print(f"  • {scene}{marker}")
-                elif command.startswith("switch "):
-                    scene_name = command[7:]
-                    try:
-                        await self.agent.set_scene(scene_name)
-                        print(f"✅ Switched to scene: {scene_name}")
-                    except Exception as e:
-                        print(f"❌ Error switching scene: {e}")
-                elif command == "stats":
-                    stats = self.agent.get_automation_stats()
-                    print("Automation Statistics:")
-                    for key, value in stats.items():
-                        print(f"  {key}: {value}")
-                elif command == "rules":
-                    stats = self.agent.get_automation_stats()
-                    print(f"Total rules: {stats.get('total_rules', 0)}")
-                    print(f"Active rules: {stats.get('active_rules', 0)}")
+                if command.startswith("switch "):
+                    await self._cmd_switch(command[7:])
+                    continue
+
+                handler = self._COMMANDS.get(command)
+                if handler:
+                    await handler(self)
                 else:
                     print("Unknown command. Type 'quit' to exit.")
 
             except KeyboardInterrupt:
                 break
 
+    async def _cmd_scenes(self):
+        """List scenes, marking the current one."""
+        scenes = await self._scenes()
+        current = await self.agent.get_current_scene()
+        print("Available scenes:")
+        for scene in scenes:
+            marker = " (current)" if scene == current else ""
+            print(f"  • {scene}{marker}")
+
+    async def _cmd_switch(self, scene_name):
+        """Switch to the named scene."""
+        try:
+            await self.agent.set_scene(scene_name)
+            print(f"✅ Switched to scene: {scene_name}")
+        except Exception as e:
+            print(f"❌ Error switching scene: {e}")
+
+    async def _cmd_stats(self):
+        """Print every automation statistic."""
+        stats = self.agent.get_automation_stats()
+        print("Automation Statistics:")
+        for key, value in stats.items():
+            print(f"  {key}: {value}")
+
+    async def _cmd_rules(self):
+        """Print rule counts."""
+        stats = self.agent.get_automation_stats()
+        print(f"Total rules: {stats.get('total_rules', 0)}")
+        print(f"Active rules: {stats.get('active_rules', 0)}")
+
+    # Interactive commands that take no argument ("quit" and "switch <scene>" are handled inline)
+    _COMMANDS = {
+        "scenes": _cmd_scenes,
+        "stats": _cmd_stats,
+        "rules": _cmd_rules,
+    }
+
 
 async def main():
     """Run the automation demo."""
@@ -371,4 +441,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
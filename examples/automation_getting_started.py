@@ -13,18 +13,28 @@ What you'll learn:
 
 Prerequisites:
 - OBS Studio running with WebSocket server enabled
-- Python 3.9+ with obs-agent installed
+- Python 3.9+ with obs-agent installed (pip install -e . from a checkout)
 """
 
 import asyncio
-import os
-import sys
 
-# Add src to path for development
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from example_helpers import wait_for_stop
 
-from src.obs_agent import OBSAgent
-from src.obs_agent.events import InputMuteStateChanged, CurrentProgramSceneChanged
+from obs_agent import CurrentProgramSceneChanged, InputMuteStateChanged
+from obs_agent import OBSAgentV2 as OBSAgent
+
+# Input names treated as your microphone (add yours if it is named differently)
+MIC_SOURCES = frozenset({"Microphone", "Mic", "Mic/Aux"})
+
+
+def _is_mic(event):
+    """Only trigger for the microphone"""
+    return event.input_name in MIC_SOURCES
+
+
+def _is_mic_muted(event):
+    """Only trigger when the microphone gets muted"""
+    return event.input_name in MIC_SOURCES and event.input_muted
 
 
 async def getting_started_tutorial():
@@ -67,10 +77,7 @@ async def getting_started_tutorial():
     # Step 3: Microphone mute automation  
     print("\n🎤 Step 3: Microphone mute automation...")
     
-    @agent.automation.when(
-        InputMuteStateChanged, 
-        lambda event: "Mic" in event.input_name  # Only trigger for microphone
-    )
+    @agent.automation.when(InputMuteStateChanged, _is_mic)
     @agent.automation.description("React to microphone mute changes")
     async def mic_mute_handler(context):
         """This runs when you mute/unmute your microphone!"""
@@ -105,10 +112,7 @@ async def getting_started_tutorial():
         delay_seconds=5.0          # Wait 5 seconds before switching
     )
     
-    @agent.automation.when(
-        InputMuteStateChanged,
-        lambda e: "Mic" in e.input_name and e.input_muted
-    )
+    @agent.automation.when(InputMuteStateChanged, _is_mic_muted)
     async def activate_brb(context):
         await brb_action(context)
         print("🚶 BRB mode activated - switched to BRB scene!")
@@ -127,8 +131,9 @@ async def getting_started_tutorial():
     print("\nPress Ctrl+C when you're done exploring...")
     
     try:
-        # Keep running for 5 minutes
-        await asyncio.sleep(300)
+        # Keep running for 5 minutes, or until Ctrl+C
+        if await wait_for_stop(asyncio.Event(), timeout=300):
+            print("\n⏹️ Stopping automation...")
     except KeyboardInterrupt:
         print("\n⏹️ Stopping automation...")
     
@@ -186,4 +191,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
@@ -3,13 +3,71 @@ import json
 import logging
 import os
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 from advanced_features import AdvancedOBSAgent, AdvancedOBSController
 from dotenv import load_dotenv
 
 load_dotenv()
-logging.basicConfig(level=logging.INFO)
+# LOG_LEVEL (e.g. WARNING) quiets the automations without a code change
+logging.basicConfig(level=os.getenv("LOG_LEVEL", "INFO").upper())
+
+
+# Idle waits longer than twice this are broken up by a GetVersion keepalive (seconds)
+KEEPALIVE_INTERVAL = 30.0
+
+# Scene and source names the automations below expect in OBS
+SCENE_STARTING = "Starting Soon"
+SCENE_GAMING = "Gaming"
+SCENE_ENDING = "Ending Soon"
+SCENE_WIDE = "Wide Shot"
+SCENE_SPEAKER = "Speaker"
+SCENE_AUDIENCE = "Audience"
+SCENE_PRESENTATION = "Presentation"
+SRC_MIC = "Microphone"
+SRC_GAME_AUDIO = "Game Audio"
+SRC_GAME_CAPTURE = "Game Capture"
+SRC_WEBCAM = "Webcam"
+SRC_HOST_MIC = "Host Microphone"
+SRC_GUEST_MIC = "Guest Microphone"
+
+# Multi-camera event schedule: (scene, seconds on it)
+EVENT_SCHEDULE = (
+    (SCENE_WIDE, 60),
+    (SCENE_SPEAKER, 300),
+    (SCENE_PRESENTATION, 600),
+    (SCENE_SPEAKER, 120),
+    (SCENE_AUDIENCE, 60),
+    (SCENE_WIDE, 60),
+)
+
+# Fixed automation data, built once at import and read-only from then on
+# (a podcast scene may set its own "target_range" for the audio monitor)
+PODCAST_TARGET_RANGE = (-25.0, -15.0)
+PODCAST_SCENES = (
+    MappingProxyType({"scene": "Intro", "duration": 5}),
+    MappingProxyType({"scene": "Host Only", "duration": 30}),
+    MappingProxyType({"scene": "Split Screen", "duration": 1800}),  # 30 minutes
+    MappingProxyType({"scene": "Outro", "duration": 5}),
+)
+
+TUTORIAL_SECTIONS = (
+    MappingProxyType({"title": "Introduction", "instruction": "Welcome to the tutorial", "duration": 10}),
+    MappingProxyType({"title": "Setup", "instruction": "First, let's configure the settings", "duration": 30}),
+    MappingProxyType({"title": "Main Content", "instruction": "Now for the main demonstration", "duration": 120}),
+    MappingProxyType({"title": "Conclusion", "instruction": "Thank you for watching!", "duration": 10}),
+)
+
+OVERLAYS = MappingProxyType(
+    {
+        "follower_alert": MappingProxyType({"text": "New Follower: {name}", "duration": 5, "position": (0.5, 0.1)}),
+        "donation_alert": MappingProxyType(
+            {"text": "{name} donated ${amount}", "duration": 10, "position": (0.5, 0.9)}
+        ),
+        "chat_highlight": MappingProxyType({"text": "{message}", "duration": 15, "position": (0.1, 0.8)}),
+    }
+)
 
 
 class OBSAutomation:
@@ -17,95 +75,126 @@ class OBSAutomation:
         self.agent = AdvancedOBSAgent(password=password or os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
         self.controller = AdvancedOBSController(self.agent)
         self.logger = logging.getLogger(__name__)
+        self._users = 0
 
     async def __aenter__(self):
-        await self.agent.connect()
+        # Nested `async with` blocks share the connection opened by the outermost one
+        if not self.agent.connected:
+            await self.agent.connect()
+        self._users += 1
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        self.agent.disconnect()
+        self._users -= 1
+        if self._users == 0:
+            self.agent.disconnect()
+
+    async def idle(self, seconds: float):
+        """Sleep for seconds, checking the OBS connection every KEEPALIVE_INTERVAL on long waits."""
+        if seconds <= 2 * KEEPALIVE_INTERVAL:
+            await asyncio.sleep(seconds)
+            return
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + seconds
+        while True:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(remaining, KEEPALIVE_INTERVAL))
+            if deadline - loop.time() > 0:
+                try:
+                    await self.agent.get_version()
+                except Exception as e:
+                    self.logger.warning("OBS keepalive failed: %s", e)
+
+
+# One OBS connection per process, shared by every automation in this module
+_SHARED_AUTOMATION: Optional[OBSAutomation] = None
+
+
+def get_automation() -> OBSAutomation:
+    """Return the process-wide OBSAutomation so scripts never open a second connection."""
+    global _SHARED_AUTOMATION
+    if _SHARED_AUTOMATION is None:
+        _SHARED_AUTOMATION = OBSAutomation()
+    return _SHARED_AUTOMATION
 
 
 async def podcast_recording_automation():
-    async with OBSAutomation() as automation:
+    async with get_automation() as automation:
         # Setup podcast recording
         print("Setting up podcast recording...")
 
-        # Configure audio sources
-        await automation.controller.apply_noise_suppression("Host Microphone", suppression_level=-30)
-        await automation.controller.apply_compressor("Host Microphone", ratio=6.0, threshold=-24.0)
-
-        await automation.controller.apply_noise_suppression("Guest Microphone", suppression_level=-30)
-        await automation.controller.apply_compressor("Guest Microphone", ratio=6.0, threshold=-24.0)
+        # Configure audio sources (independent filters, so issue them together)
+        await asyncio.gather(
+            automation.controller.apply_noise_suppression(SRC_HOST_MIC, suppression_level=-30),
+            automation.controller.apply_compressor(SRC_HOST_MIC, ratio=6.0, threshold=-24.0),
+            automation.controller.apply_noise_suppression(SRC_GUEST_MIC, suppression_level=-30),
+            automation.controller.apply_compressor(SRC_GUEST_MIC, ratio=6.0, threshold=-24.0),
+        )
 
         # Balance audio levels
         await automation.controller.balance_audio_levels(target_db=-20.0)
 
-        # Set up scenes
-        scenes_sequence = [
-            {"scene": "Intro", "duration": 5},
-            {"scene": "Host Only", "duration": 30},
-            {"scene": "Split Screen", "duration": 1800},  # 30 minutes
-            {"scene": "Outro", "duration": 5},
-        ]
-
         # Start recording
         print("Starting podcast recording...")
         await automation.agent.start_recording()
 
-        # Execute scene sequence
-        for scene_config in scenes_sequence:
-            scene_name = scene_config["scene"]
-            duration = scene_config["duration"]
+        # One audio monitor for the whole recording, following the current scene's range
+        target_range = [PODCAST_TARGET_RANGE]
+        monitor = asyncio.create_task(automation.controller.monitor_audio_until_cancelled(lambda: target_range[0]))
+        try:
+            # Execute scene sequence against absolute deadlines
+            loop = asyncio.get_running_loop()
+            deadline = loop.time()
+            for scene_config in PODCAST_SCENES:
+                scene_name = scene_config["scene"]
+                deadline += scene_config["duration"]
+                target_range[0] = scene_config.get("target_range", PODCAST_TARGET_RANGE)
 
-            print(f"Switching to scene: {scene_name}")
-            await automation.agent.set_scene(scene_name)
+                print(f"Switching to scene: {scene_name}")
+                await automation.agent.set_scene(scene_name)
 
-            # Monitor audio levels during recording
-            monitor_task = asyncio.create_task(
-                automation.controller.monitor_and_auto_adjust_audio(
-                    duration_seconds=duration, target_range=(-25.0, -15.0)
-                )
-            )
+                await asyncio.sleep(max(0.0, deadline - loop.time()))
 
-            await asyncio.sleep(duration)
-            monitor_task.cancel()
-
-        # Stop recording
-        output_path = await automation.agent.stop_recording()
-        print(f"Podcast recording saved to: {output_path}")
+            # Stop recording
+            output_path = await automation.agent.stop_recording()
+            print(f"Podcast recording saved to: {output_path}")
+        finally:
+            monitor.cancel()
 
         return output_path
 
 
 async def gaming_stream_automation():
-    async with OBSAutomation() as automation:
+    async with get_automation() as automation:
         print("Setting up gaming stream...")
 
         # Configure scenes
-        await automation.agent.set_scene("Starting Soon")
+        await automation.agent.set_scene(SCENE_STARTING)
 
         # Apply filters to webcam
-        await automation.controller.apply_chroma_key("Webcam", key_color=0x00FF00)
-
-        # Configure audio
-        await automation.agent.set_source_volume("Game Audio", volume_db=-15.0)
-        await automation.agent.set_source_volume("Microphone", volume_db=-20.0)
-        await automation.controller.apply_noise_suppression("Microphone", suppression_level=-40)
-
-        # Create PIP layout for webcam
-        await automation.controller.create_pip_layout(
-            main_source="Game Capture", pip_source="Webcam", pip_position=(0.75, 0.75), pip_scale=0.2
+        await automation.controller.apply_chroma_key(SRC_WEBCAM, key_color=0x00FF00)
+
+        # Configure audio and create the PIP layout for the webcam together
+        await asyncio.gather(
+            automation.agent.set_source_volume(SRC_GAME_AUDIO, volume_db=-15.0),
+            automation.agent.set_source_volume(SRC_MIC, volume_db=-20.0),
+            automation.controller.apply_noise_suppression(SRC_MIC, suppression_level=-40),
+            automation.controller.create_pip_layout(
+                main_source=SRC_GAME_CAPTURE, pip_source=SRC_WEBCAM, pip_position=(0.75, 0.75), pip_scale=0.2
+            ),
         )
 
         # Countdown and start stream
         print("Starting countdown...")
         await automation.controller.create_stream_starting_sequence(
-            countdown_seconds=10, starting_scene="Starting Soon"
+            countdown_seconds=10, starting_scene=SCENE_STARTING
         )
 
         # Switch to game scene
-        await automation.agent.set_scene("Gaming")
+        await automation.agent.set_scene(SCENE_GAMING)
 
         # Enable replay buffer for highlights
         await automation.agent.start_replay_buffer()
@@ -124,7 +213,7 @@ async def gaming_stream_automation():
 
         # End stream sequence
         print("Ending stream...")
-        await automation.agent.set_scene("Ending Soon")
+        await automation.agent.set_scene(SCENE_ENDING)
         await asyncio.sleep(30)
 
         # Stop everything
@@ -136,48 +225,42 @@ async def gaming_stream_automation():
 
 
 async def tutorial_recording_automation():
-    async with OBSAutomation() as automation:
+    async with get_automation() as automation:
         print("Setting up tutorial recording...")
 
-        # Configure sources
-        await automation.agent.create_source(
-            scene_name="Tutorial", source_name="Screen Capture", source_kind="monitor_capture", settings={"monitor": 0}
-        )
-
-        await automation.agent.create_source(
-            scene_name="Tutorial",
-            source_name="Mouse Highlight",
-            source_kind="color_source",
-            settings={"color": 0xFFFF00, "width": 50, "height": 50},
-        )
-
-        # Add text overlay for instructions
-        await automation.agent.create_source(
-            scene_name="Tutorial",
-            source_name="Instructions",
-            source_kind="text_gdiplus_v2",
-            settings={
-                "text": "Press Space to continue",
-                "font": {"face": "Arial", "size": 36},
-                "color": 0xFFFFFF,
-                "outline": True,
-                "outline_color": 0x000000,
-                "outline_size": 2,
-            },
+        # Configure sources, including the text overlay for instructions
+        await asyncio.gather(
+            automation.agent.create_source(
+                scene_name="Tutorial",
+                source_name="Screen Capture",
+                source_kind="monitor_capture",
+                settings={"monitor": 0},
+            ),
+            automation.agent.create_source(
+                scene_name="Tutorial",
+                source_name="Mouse Highlight",
+                source_kind="color_source",
+                settings={"color": 0xFFFF00, "width": 50, "height": 50},
+            ),
+            automation.agent.create_source(
+                scene_name="Tutorial",
+                source_name="Instructions",
+                source_kind="text_gdiplus_v2",
+                settings={
+                    "text": "Press Space to continue",
+                    "font": {"face": "Arial", "size": 36},
+                    "color": 0xFFFFFF,
+                    "outline": True,
+                    "outline_color": 0x000000,
+                    "outline_size": 2,
+                },
+            ),
         )
 
-        # Tutorial sections
-        sections = [
-            {"title": "Introduction", "instruction": "Welcome to the tutorial", "duration": 10},
-            {"title": "Setup", "instruction": "First, let's configure the settings", "duration": 30},
-            {"title": "Main Content", "instruction": "Now for the main demonstration", "duration": 120},
-            {"title": "Conclusion", "instruction": "Thank you for watching!", "duration": 10},
-        ]
-
         # Start recording
         await automation.agent.start_recording()
 
-        for section in sections:
+        for section in TUTORIAL_SECTIONS:
             # Update instruction text
             await automation.agent.set_source_settings("Instructions", {"text": section["instruction"]})
 
@@ -189,24 +272,18 @@ async def tutorial_recording_automation():
         print(f"Tutorial saved to: {output_path}")
 
         # Clean up created sources
-        await automation.agent.remove_source("Instructions")
-        await automation.agent.remove_source("Mouse Highlight")
+        await asyncio.gather(
+            automation.agent.remove_source("Instructions"),
+            automation.agent.remove_source("Mouse Highlight"),
+        )
 
         return output_path
 
 
 async def multi_camera_event_automation():
-    async with OBSAutomation() as automation:
+    async with get_automation() as automation:
         print("Setting up multi-camera event...")
 
-        # Camera configuration
-        cameras = [
-            {"name": "Camera 1 - Wide", "scene": "Wide Shot"},
-            {"name": "Camera 2 - Speaker", "scene": "Speaker"},
-            {"name": "Camera 3 - Audience", "scene": "Audience"},
-            {"name": "Camera 4 - Slides", "scene": "Presentation"},
-        ]
-
         # Configure transitions
         await automation.agent.set_transition("Fade")
         await automation.agent.set_transition_duration(500)
@@ -215,30 +292,29 @@ async def multi_camera_event_automation():
         await automation.agent.start_recording()
         await automation.agent.start_streaming()
 
-        # Event schedule
-        event_schedule = [
-            {"scene": "Wide Shot", "duration": 60},
-            {"scene": "Speaker", "duration": 300},
-            {"scene": "Presentation", "duration": 600},
-            {"scene": "Speaker", "duration": 120},
-            {"scene": "Audience", "duration": 60},
-            {"scene": "Wide Shot", "duration": 60},
-        ]
-
-        # Execute scheduled camera switches
-        for segment in event_schedule:
-            scene = segment["scene"]
-            duration = segment["duration"]
-
-            print(f"Switching to: {scene} for {duration}s")
-            await automation.controller.create_animated_transition(
-                from_scene=await automation.agent.get_current_scene(),
-                to_scene=scene,
-                transition_type="Fade",
-                duration_ms=500,
-            )
+        # Execute scheduled camera switches against absolute deadlines so the
+        # time spent switching does not push the rest of the schedule back
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
+        # Each transition lands on its to_scene, so only the starting scene needs asking for
+        current_scene = await automation.agent.get_current_scene()
+        for scene, duration in EVENT_SCHEDULE:
+            deadline += duration
+
+            # A segment on the scene already live just extends it, with no repeat Fade
+            if scene != current_scene:
+                print(f"Switching to: {scene} for {duration}s")
+                await automation.controller.create_animated_transition(
+                    from_scene=current_scene,
+                    to_scene=scene,
+                    transition_type="Fade",
+                    duration_ms=500,
+                )
+                current_scene = scene
+            else:
+                print(f"Staying on: {scene} for {duration}s")
 
-            await asyncio.sleep(duration)
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
 
         # End event
         await automation.agent.stop_streaming()
@@ -249,23 +325,38 @@ async def multi_camera_event_automation():
 
 
 async def scheduled_recording_automation(schedule: List[Dict]):
-    async with OBSAutomation() as automation:
+    async with get_automation() as automation:
         print("Starting scheduled recording automation...")
+        agent = automation.agent
+
+        # Read the wall clock once and schedule every task on the loop's monotonic
+        # clock, so clock adjustments during a long schedule can't shift the starts
+        loop = asyncio.get_running_loop()
+        now_mono = loop.time()
+        now_wall = datetime.now()
+
+        # Scene this automation last switched to; a task on the same scene skips the switch
+        current_scene = None
 
         for task in schedule:
-            start_time = datetime.fromisoformat(task["start_time"])
+            deadline = now_mono + (datetime.fromisoformat(task["start_time"]) - now_wall).total_seconds()
             duration = task["duration_minutes"] * 60
             scene = task["scene"]
 
             # Wait until start time
-            wait_time = (start_time - datetime.now()).total_seconds()
+            wait_time = deadline - loop.time()
             if wait_time > 0:
                 print(f"Waiting {wait_time/60:.1f} minutes until next recording...")
-                await asyncio.sleep(wait_time)
+                await automation.idle(wait_time)
+
+            # Every task must run on the connection opened for the whole schedule
+            assert automation.agent is agent, "scheduled tasks must share one OBS connection"
 
             # Start recording
             print(f"Starting scheduled recording: {task['name']}")
-            await automation.agent.set_scene(scene)
+            if scene != current_scene:
+                await automation.agent.set_scene(scene)
+                current_scene = scene
             await automation.agent.start_recording()
 
             # Record for specified duration
@@ -281,31 +372,35 @@ async def scheduled_recording_automation(schedule: List[Dict]):
 
 
 async def dynamic_overlay_automation():
-    async with OBSAutomation() as automation:
+    async with get_automation() as automation:
         print("Setting up dynamic overlays...")
 
-        # Create overlay sources
-        overlays = {
-            "follower_alert": {"text": "New Follower: {name}", "duration": 5, "position": (0.5, 0.1)},
-            "donation_alert": {"text": "{name} donated ${amount}", "duration": 10, "position": (0.5, 0.9)},
-            "chat_highlight": {"text": "{message}", "duration": 15, "position": (0.1, 0.8)},
-        }
-
-        # Create text sources for overlays
-        for overlay_name, config in overlays.items():
-            await automation.agent.create_source(
-                scene_name="Main",
-                source_name=overlay_name,
-                source_kind="text_gdiplus_v2",
-                settings={
-                    "text": "",
-                    "font": {"face": "Arial", "size": 48},
-                    "color": 0xFFFFFF,
-                    "outline": True,
-                    "outline_color": 0x000000,
-                    "outline_size": 3,
-                },
+        # Create text sources for overlays; create_source returns each new scene item id
+        item_ids = await asyncio.gather(
+            *(
+                automation.agent.create_source(
+                    scene_name="Main",
+                    source_name=overlay_name,
+                    source_kind="text_gdiplus_v2",
+                    settings={
+                        "text": "",
+                        "font": {"face": "Arial", "size": 48},
+                        "color": 0xFFFFFF,
+                        "outline": True,
+                        "outline_color": 0x000000,
+                        "outline_size": 3,
+                    },
+                )
+                for overlay_name in OVERLAYS
             )
+        )
+
+        item_id_by_source = {name: item_id for name, item_id in zip(OVERLAYS, item_ids) if item_id >= 0}
+
+        # Overlays left over from an earlier run could not be created again, so find those in the scene
+        if len(item_id_by_source) < len(OVERLAYS):
+            for item in await automation.agent.get_scene_items("Main"):
+                item_id_by_source.setdefault(item["sourceName"], item["sceneItemId"])
 
         # Simulate alerts (in real use, these would come from external sources)
         alerts = [
@@ -314,35 +409,41 @@ async def dynamic_overlay_automation():
             {"type": "chat_highlight", "data": {"message": "Great stream!"}},
         ]
 
-        # Process alerts
-        for alert in alerts:
+        async def show_alert(alert):
             alert_type = alert["type"]
-            alert_data = alert["data"]
-            overlay_config = overlays[alert_type]
+            overlay_config = OVERLAYS[alert_type]
 
             # Format text
-            text = overlay_config["text"].format(**alert_data)
-
-            # Update overlay text
-            await automation.agent.set_source_settings(alert_type, {"text": text})
-
-            # Show overlay
-            scene_items = await automation.agent.get_scene_items("Main")
-            for item in scene_items:
-                if item.get("sourceName") == alert_type:
-                    await automation.agent.set_scene_item_enabled("Main", item["sceneItemId"], True)
-                    break
+            text = overlay_config["text"].format(**alert["data"])
+
+            # Update overlay text and show it in one batch
+            item_id = item_id_by_source.get(alert_type)
+            batch = [
+                {
+                    "requestType": "SetInputSettings",
+                    "requestData": {"inputName": alert_type, "inputSettings": {"text": text}},
+                }
+            ]
+            if item_id is not None:
+                batch.append(
+                    {
+                        "requestType": "SetSceneItemEnabled",
+                        "requestData": {"sceneName": "Main", "sceneItemId": item_id, "sceneItemEnabled": True},
+                    }
+                )
+            await automation.agent.batch(batch)
 
             print(f"Showing alert: {text}")
 
-            # Wait for duration
-            await asyncio.sleep(overlay_config["duration"])
+            # Wait for duration, hiding the overlay even if the alert is cancelled
+            try:
+                await asyncio.sleep(overlay_config["duration"])
+            finally:
+                if item_id is not None:
+                    await automation.agent.set_scene_item_enabled("Main", item_id, False)
 
-            # Hide overlay
-            for item in scene_items:
-                if item.get("sourceName") == alert_type:
-                    await automation.agent.set_scene_item_enabled("Main", item["sceneItemId"], False)
-                    break
+        # Each alert has its own overlay, so they are shown side by side
+        await asyncio.gather(*(show_alert(alert) for alert in alerts))
 
 
 async def main():
@@ -354,21 +455,30 @@ async def main():
     print("4. Multi-Camera Event")
     print("5. Dynamic Overlays Demo")
 
-    choice = input("\nSelect automation (1-5): ")
-
-    automations = {
-        "1": podcast_recording_automation,
-        "2": gaming_stream_automation,
-        "3": tutorial_recording_automation,
-        "4": multi_camera_event_automation,
-        "5": dynamic_overlay_automation,
-    }
+    # Prompt in a worker thread and open the shared OBS connection while the user types
+    choice_future = asyncio.get_running_loop().run_in_executor(None, input, "\nSelect automation (1-5): ")
+    async with get_automation():
+        choice = await choice_future
+
+        automations = {
+            "1": podcast_recording_automation,
+            "2": gaming_stream_automation,
+            "3": tutorial_recording_automation,
+            "4": multi_camera_event_automation,
+            "5": dynamic_overlay_automation,
+        }
 
-    if choice in automations:
-        await automations[choice]()
-    else:
-        print("Invalid choice")
+        if choice in automations:
+            await automations[choice]()
+        else:
+            print("Invalid choice")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
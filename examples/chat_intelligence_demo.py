@@ -10,9 +10,9 @@ import logging
 import os
 from datetime import datetime
 
-# Set up logging
+# Set up logging (LOG_LEVEL overrides the INFO default)
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.getenv("LOG_LEVEL", "INFO").upper(),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
@@ -21,15 +21,6 @@ logger = logging.getLogger(__name__)
 import sys
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-try:
-    from crew.chat_intelligence_integration import setup_chat_intelligence
-    from obs_agent.chat_intelligence import ChatIntelligenceService
-    from obs_agent.advanced_features import AdvancedOBSAgent
-except ImportError as e:
-    logger.error(f"Import error: {e}")
-    logger.error("Make sure you're running from the correct directory and all dependencies are installed")
-    sys.exit(1)
-
 
 class ChatIntelligenceDemo:
     """Demonstration of the Chat Intelligence system."""
@@ -38,28 +29,52 @@ class ChatIntelligenceDemo:
         self.obs_agent = None
         self.chat_integration = None
     
-    async def setup_obs_connection(self):
-        """Set up OBS connection (optional for demo)."""
+    def _build_agent(self):
+        """Create the OBS agent without connecting it (optional for demo)."""
         try:
-            # Try to connect to OBS (will fail gracefully if OBS not running)
-            self.obs_agent = AdvancedOBSAgent(
-                host=os.getenv('OBS_HOST', 'localhost'),
-                port=int(os.getenv('OBS_PORT', '4455')),
-                password=os.getenv('OBS_PASSWORD', '')
-            )
-            
-            await self.obs_agent.connect()
+            # Imported here so paths that never touch OBS don't pay for it
+            from obs_agent.advanced_features import AdvancedOBSAgent
+        except ImportError as e:
+            logger.warning("⚠️ OBS agent unavailable: %s", e)
+            logger.info("Demo will continue without OBS integration")
+            return
+
+        self.obs_agent = AdvancedOBSAgent(
+            host=os.getenv('OBS_HOST', 'localhost'),
+            port=int(os.getenv('OBS_PORT', '4455')),
+            password=os.getenv('OBS_PASSWORD', '')
+        )
+
+    async def _connect_agent(self):
+        """Connect the OBS agent built by _build_agent."""
+        if self.obs_agent is None:
+            return False
+
+        try:
+            # Try to connect to OBS (will fail gracefully if OBS not running).
+            # connect() does the websocket handshake without ever yielding, so it
+            # runs on a worker thread to let chat intelligence set up meanwhile.
+            if not await asyncio.to_thread(asyncio.run, self.obs_agent.connect()):
+                raise ConnectionError("OBS Studio is not reachable")
             logger.info("✅ Connected to OBS Studio")
             return True
             
         except Exception as e:
-            logger.warning(f"⚠️ Could not connect to OBS: {e}")
+            logger.warning("⚠️ Could not connect to OBS: %s", e)
             logger.info("Demo will continue without OBS integration")
             self.obs_agent = None
             return False
     
     async def setup_chat_intelligence(self):
         """Set up the chat intelligence system."""
+        try:
+            # CrewAI and the chat stack are heavy, so load them only when needed
+            from crew.chat_intelligence_integration import setup_chat_intelligence
+        except ImportError as e:
+            logger.error("Import error: %s", e)
+            logger.error("Make sure you're running from the correct directory and all dependencies are installed")
+            return False
+
         try:
             # Initialize chat intelligence integration
             self.chat_integration = await setup_chat_intelligence(
@@ -72,7 +87,7 @@ class ChatIntelligenceDemo:
             return True
             
         except Exception as e:
-            logger.error(f"❌ Failed to setup chat intelligence: {e}")
+            logger.error("❌ Failed to setup chat intelligence: %s", e)
             return False
     
     async def demonstrate_chat_analysis(self):
@@ -86,19 +101,23 @@ class ChatIntelligenceDemo:
             ('discord', 'demo_guild_id/demo_channel_id')
         ]
         
-        for platform, channel in demo_channels:
-            try:
-                success = await self.chat_integration.add_chat_channel(platform, channel)
-                logger.info(f"{'✅' if success else '❌'} Added {platform} channel: {channel}")
-            except Exception as e:
-                logger.warning(f"⚠️ Could not add {platform} channel: {e}")
+        # Each platform connects independently, so join them all at once
+        results = await asyncio.gather(
+            *(self.chat_integration.add_chat_channel(platform, channel) for platform, channel in demo_channels),
+            return_exceptions=True
+        )
+        for (platform, channel), result in zip(demo_channels, results):
+            if isinstance(result, Exception):
+                logger.warning("⚠️ Could not add %s channel: %s", platform, result)
+            else:
+                logger.info("%s Added %s channel: %s", '✅' if result else '❌', platform, channel)
         
         # Simulate some analysis
         await asyncio.sleep(2)
         
         # Get chat statistics
         stats = self.chat_integration.get_chat_stats()
-        logger.info(f"📊 Chat Stats: {stats}")
+        logger.info("📊 Chat Stats: %s", stats)
     
     async def demonstrate_sentiment_analysis(self):
         """Demonstrate sentiment analysis."""
@@ -106,9 +125,9 @@ class ChatIntelligenceDemo:
         
         try:
             sentiment_result = await self.chat_integration.quick_sentiment()
-            logger.info(f"Sentiment Analysis Result:\n{sentiment_result}")
+            logger.info("Sentiment Analysis Result:\n%s", sentiment_result)
         except Exception as e:
-            logger.error(f"Error in sentiment analysis: {e}")
+            logger.error("Error in sentiment analysis: %s", e)
     
     async def demonstrate_engagement_monitoring(self):
         """Demonstrate engagement monitoring."""
@@ -116,9 +135,9 @@ class ChatIntelligenceDemo:
         
         try:
             engagement_result = await self.chat_integration.engagement_status()
-            logger.info(f"Engagement Status:\n{engagement_result}")
+            logger.info("Engagement Status:\n%s", engagement_result)
         except Exception as e:
-            logger.error(f"Error in engagement monitoring: {e}")
+            logger.error("Error in engagement monitoring: %s", e)
     
     async def demonstrate_moderation_features(self):
         """Demonstrate moderation capabilities."""
@@ -126,9 +145,9 @@ class ChatIntelligenceDemo:
         
         try:
             moderation_result = await self.chat_integration.moderation_status()
-            logger.info(f"Moderation Status:\n{moderation_result}")
+            logger.info("Moderation Status:\n%s", moderation_result)
         except Exception as e:
-            logger.error(f"Error in moderation check: {e}")
+            logger.error("Error in moderation check: %s", e)
     
     async def demonstrate_comprehensive_analysis(self):
         """Demonstrate comprehensive chat analysis."""
@@ -137,9 +156,9 @@ class ChatIntelligenceDemo:
         try:
             context = "Live streaming demo with multiple chat platforms"
             analysis_result = await self.chat_integration.analyze_chat(context)
-            logger.info(f"Comprehensive Analysis:\n{analysis_result}")
+            logger.info("Comprehensive Analysis:\n%s", analysis_result)
         except Exception as e:
-            logger.error(f"Error in comprehensive analysis: {e}")
+            logger.error("Error in comprehensive analysis: %s", e)
     
     async def demonstrate_automation_features(self):
         """Demonstrate automation capabilities."""
@@ -164,18 +183,22 @@ class ChatIntelligenceDemo:
         # Demonstrate manual trigger
         try:
             trigger_result = await self.chat_integration.manual_trigger("comprehensive")
-            logger.info(f"Manual Trigger Result:\n{trigger_result}")
+            logger.info("Manual Trigger Result:\n%s", trigger_result)
         except Exception as e:
-            logger.error(f"Error in manual trigger: {e}")
+            logger.error("Error in manual trigger: %s", e)
     
     async def run_demo(self):
         """Run the complete demonstration."""
         logger.info("🚀 Starting Chat Intelligence Demo")
         logger.info("=" * 50)
         
-        # Setup
-        obs_connected = await self.setup_obs_connection()
-        chat_setup = await self.setup_chat_intelligence()
+        # Setup: chat intelligence only needs the agent object, not a live
+        # connection, so the OBS handshake runs while it initializes
+        self._build_agent()
+        obs_connected, chat_setup = await asyncio.gather(
+            self._connect_agent(),
+            self.setup_chat_intelligence(),
+        )
         
         if not chat_setup:
             logger.error("❌ Failed to setup chat intelligence system")
@@ -184,17 +207,28 @@ class ChatIntelligenceDemo:
         try:
             # Run demonstrations
             await self.demonstrate_chat_analysis()
-            await self.demonstrate_sentiment_analysis()
-            await self.demonstrate_engagement_monitoring()
-            await self.demonstrate_moderation_features()
-            await self.demonstrate_comprehensive_analysis()
+
+            # These are independent read-only queries, so run them side by side
+            # (their log lines may interleave)
+            await asyncio.gather(
+                self.demonstrate_sentiment_analysis(),
+                self.demonstrate_engagement_monitoring(),
+                self.demonstrate_moderation_features(),
+                self.demonstrate_comprehensive_analysis()
+            )
+
+            # Changes thresholds and settings, so it runs on its own
             await self.demonstrate_automation_features()
             
-            # Run for a short period to show continuous monitoring
-            logger.info("\n⏰ Running continuous monitoring for 30 seconds...")
+            # Run for a short period to show continuous monitoring, finishing
+            # early once the chat goes quiet
+            logger.info("\n⏰ Running continuous monitoring for up to 30 seconds...")
             logger.info("(In real usage, this would run continuously during streaming)")
             
-            await asyncio.sleep(30)
+            try:
+                await asyncio.wait_for(self.chat_integration.wait_idle(), timeout=30)
+            except asyncio.TimeoutError:
+                pass
             
         finally:
             # Cleanup
@@ -237,10 +271,16 @@ if __name__ == "__main__":
     """)
     
     try:
-        asyncio.run(main())
+        # Use uvloop's faster event loop when it is installed
+        try:
+            import uvloop
+        except ImportError:
+            asyncio.run(main())
+        else:
+            uvloop.run(main())
     except KeyboardInterrupt:
         logger.info("\n👋 Demo interrupted by user")
     except Exception as e:
-        logger.error(f"❌ Demo failed: {e}")
+        logger.error("❌ Demo failed: %s", e)
         import traceback
         traceback.print_exc()
\ No newline at end of file
@@ -3,13 +3,28 @@
 
 import asyncio
 import os
+import time
 
 from advanced_features import AdvancedOBSAgent
+from demo_helpers import AUDIO_KINDS, create_scenes
 from dotenv import load_dotenv
 
-from obs_agent import OBSAgent
+from obs_agent import OBSAgent, use_orjson
 
 load_dotenv()
+use_orjson()
+
+# Interactive menu, printed in one call before every prompt
+MENU_OPTIONS = """
+📋 Options:
+1. Show current status
+2. Create demo scenes
+3. Start/Stop recording
+4. Add text overlay
+5. Audio level check
+6. Take screenshot
+7. Scene automation demo
+8. Exit"""
 
 
 async def demo_menu():
@@ -23,30 +38,29 @@ async def demo_menu():
     print("\n🎬 OBS Agent Demo")
     print("=" * 40)
 
+    # Prompts are read in a worker thread so the event loop keeps serving OBS meanwhile
+    loop = asyncio.get_running_loop()
+
+    # Scene names, fetched once and kept current by the options that create scenes
+    # (showing the status re-reads them, picking up scenes added in OBS itself)
+    scenes_cache = await agent.get_scenes()
+
     while True:
-        print("\n📋 Options:")
-        print("1. Show current status")
-        print("2. Create demo scenes")
-        print("3. Start/Stop recording")
-        print("4. Add text overlay")
-        print("5. Audio level check")
-        print("6. Take screenshot")
-        print("7. Scene automation demo")
-        print("8. Exit")
-
-        choice = input("\nSelect option (1-8): ").strip()
+        print(MENU_OPTIONS)
+
+        choice = (await loop.run_in_executor(None, input, "\nSelect option (1-8): ")).strip()
 
         try:
             if choice == "1":
                 # Show status
                 current_scene = await agent.get_current_scene()
-                scenes = await agent.get_scenes()
+                scenes_cache = await agent.get_scenes()
                 sources = await agent.get_sources()
                 recording = await agent.get_recording_status()
 
                 print(f"\n📊 Current Status:")
                 print(f"🎬 Scene: {current_scene}")
-                print(f"📋 Total Scenes: {len(scenes)}")
+                print(f"📋 Total Scenes: {len(scenes_cache)}")
                 print(f"🎤 Total Sources: {len(sources)}")
                 print(f"🔴 Recording: {'Yes' if recording['is_recording'] else 'No'}")
 
@@ -55,12 +69,15 @@ async def demo_menu():
                 print("\n🎨 Creating demo scenes...")
 
                 demo_scenes = ["Main", "Gaming", "Starting Soon", "Be Right Back", "Ending"]
+                to_create = [scene_name for scene_name in demo_scenes if scene_name not in scenes_cache]
+                created = await create_scenes(agent, to_create)
                 for scene_name in demo_scenes:
-                    if scene_name not in await agent.get_scenes():
-                        await agent.create_scene(scene_name)
-                        print(f"✅ Created scene: {scene_name}")
-                    else:
+                    if scene_name not in to_create:
                         print(f"ℹ️  Scene already exists: {scene_name}")
+                for scene_name, ok in zip(to_create, created):
+                    if ok:
+                        scenes_cache.append(scene_name)
+                        print(f"✅ Created scene: {scene_name}")
 
             elif choice == "3":
                 # Toggle recording
@@ -76,7 +93,7 @@ async def demo_menu():
             elif choice == "4":
                 # Add text overlay
                 current_scene = await agent.get_current_scene()
-                text = input("\nEnter text for overlay: ")
+                text = await loop.run_in_executor(None, input, "\nEnter text for overlay: ")
 
                 item_id = await agent.create_source(
                     scene_name=current_scene,
@@ -94,7 +111,7 @@ async def demo_menu():
                 # Check audio levels
                 print("\n🎤 Audio Sources:")
                 sources = await agent.get_sources()
-                audio_sources = [s for s in sources if "Audio" in s.get("inputKind", "")]
+                audio_sources = [s for s in sources if s.get("inputKind") in AUDIO_KINDS]
 
                 if not audio_sources:
                     print("No audio sources found")
@@ -111,7 +128,7 @@ async def demo_menu():
                 sources = await agent.get_sources()
                 if sources:
                     source_name = sources[0]["inputName"]
-                    filename = f"obs_screenshot_{asyncio.get_event_loop().time():.0f}.png"
+                    filename = f"obs_screenshot_{time.monotonic_ns()}.png"
                     success = await agent.take_screenshot(source_name, filename)
                     if success:
                         print(f"📸 Screenshot saved: {filename}")
@@ -123,7 +140,7 @@ async def demo_menu():
             elif choice == "7":
                 # Scene automation demo
                 print("\n🤖 Starting scene automation demo...")
-                scenes = await agent.get_scenes()
+                scenes = list(scenes_cache)
 
                 if len(scenes) < 2:
                     print("Please create at least 2 scenes first (option 2)")
@@ -132,11 +149,14 @@ async def demo_menu():
                     print("Press Ctrl+C to stop")
 
                     try:
+                        # Switches land on a fixed 3 second grid, however long each one takes
+                        deadline = loop.time()
                         for i in range(10):  # Switch 10 times
+                            deadline += 3
                             scene = scenes[i % len(scenes)]
                             print(f"➡️  Switching to: {scene}")
                             await agent.set_scene(scene)
-                            await asyncio.sleep(3)
+                            await asyncio.sleep(max(0.0, deadline - loop.time()))
                         print("\n✅ Demo complete!")
                     except KeyboardInterrupt:
                         print("\n⏹️  Demo stopped")
@@ -189,8 +209,10 @@ async def quick_demo():
         # Animate text
         for i, message in enumerate(messages):
             print(f"{i+1}/5: {message}")
-            await agent.set_source_settings("Demo Message", {"text": message})
+            # Send the update while the 2 second tick runs, rather than before it
+            update = asyncio.create_task(agent.set_source_settings("Demo Message", {"text": message}))
             await asyncio.sleep(2)
+            await update
 
         print("\n✅ Demo complete!")
         agent.disconnect()
@@ -199,12 +221,14 @@ async def quick_demo():
 
 
 async def main():
-    print("🎬 OBS Agent Demo")
-    print("=" * 40)
-    print("1. Interactive demo (control OBS manually)")
-    print("2. Quick automated demo")
+    print(
+        f"🎬 OBS Agent Demo\n{'=' * 40}\n"
+        "1. Interactive demo (control OBS manually)\n"
+        "2. Quick automated demo"
+    )
 
-    choice = input("\nSelect demo type (1 or 2): ").strip()
+    loop = asyncio.get_running_loop()
+    choice = (await loop.run_in_executor(None, input, "\nSelect demo type (1 or 2): ")).strip()
 
     if choice == "1":
         await demo_menu()
@@ -215,4 +239,10 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())
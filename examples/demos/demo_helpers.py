@@ -0,0 +1,35 @@
+"""
+Helpers shared by the demo scripts.
+
+The demos are run as scripts (python examples/demos/<name>.py), so they import
+this module from their own directory.
+"""
+
+from typing import List, Sequence
+
+from advanced_features import AdvancedOBSAgent
+
+# OBS input kinds that capture audio (macOS, Windows and Linux)
+AUDIO_KINDS = frozenset(
+    {
+        "coreaudio_input_capture",
+        "coreaudio_output_capture",
+        "sck_audio_capture",
+        "wasapi_input_capture",
+        "wasapi_output_capture",
+        "wasapi_process_output_capture",
+        "pulse_input_capture",
+        "pulse_output_capture",
+        "alsa_input_capture",
+        "jack_output_capture",
+    }
+)
+
+
+async def create_scenes(agent: AdvancedOBSAgent, scene_names: Sequence[str]) -> List[bool]:
+    """Create the named scenes and return each create_scene result.
+
+    The agent sends its requests synchronously, so the scenes are created one
+    after another.
+    """
+    return [await agent.create_scene(scene_name) for scene_name in scene_names]
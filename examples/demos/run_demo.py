@@ -5,11 +5,13 @@ import asyncio
 import os
 
 from advanced_features import AdvancedOBSAgent
+from demo_helpers import AUDIO_KINDS, create_scenes
 from dotenv import load_dotenv
 
-from obs_agent import OBSAgent
+from obs_agent import OBSAgent, use_orjson
 
 load_dotenv()
+use_orjson()
 
 
 async def run_demo():
@@ -23,12 +25,14 @@ async def run_demo():
         print("❌ Failed to connect to OBS")
         return
 
+    loop = asyncio.get_running_loop()
+
     try:
         # 1. Show current status
         print("\n📊 Current OBS Status:")
-        current_scene = await agent.get_current_scene()
-        scenes = await agent.get_scenes()
-        sources = await agent.get_sources()
+        current_scene, scenes, sources = await asyncio.gather(
+            agent.get_current_scene(), agent.get_scenes(), agent.get_sources()
+        )
 
         print(f"🎬 Current Scene: {current_scene}")
         print(f"📋 Available Scenes: {', '.join(scenes)}")
@@ -38,20 +42,20 @@ async def run_demo():
         print("\n🎨 Creating demo scenes...")
         demo_scenes = ["Main", "Starting Soon", "Be Right Back", "Ending"]
 
-        for scene_name in demo_scenes:
-            if scene_name not in scenes:
-                await agent.create_scene(scene_name)
+        to_create = [scene_name for scene_name in demo_scenes if scene_name not in scenes]
+        created = await create_scenes(agent, to_create)
+        for scene_name, ok in zip(to_create, created):
+            if ok:
+                scenes.append(scene_name)
                 print(f"✅ Created scene: {scene_name}")
 
         # 3. Add text to Main scene
         print("\n📝 Adding text overlay to Main scene...")
         await agent.set_scene("Main")
 
-        # Remove old demo text if exists
-        try:
+        # Remove old demo text if exists (checked against the sources fetched above)
+        if any(source["inputName"] == "Demo Text" for source in sources):
             await agent.remove_source("Demo Text")
-        except:
-            pass
 
         await agent.create_source(
             scene_name="Main",
@@ -72,14 +76,17 @@ async def run_demo():
 
         scene_sequence = [("Starting Soon", 3), ("Main", 5), ("Be Right Back", 3), ("Main", 4)]
 
+        # Each scene ends at an absolute deadline, so switch time comes out of its duration
+        deadline = loop.time()
         for scene, duration in scene_sequence:
+            deadline += duration
             print(f"  ➡️  Switching to: {scene} (for {duration}s)")
             await agent.set_scene(scene)
-            await asyncio.sleep(duration)
+            await asyncio.sleep(max(0.0, deadline - loop.time()))
 
         # 5. Audio check
         print("\n🎤 Checking audio sources...")
-        audio_sources = [s for s in await agent.get_sources() if "Audio" in s.get("inputKind", "")]
+        audio_sources = [s for s in sources if s.get("inputKind") in AUDIO_KINDS]
 
         if audio_sources:
             for source in audio_sources:
@@ -91,7 +98,8 @@ async def run_demo():
 
         # 6. Recording demo
         print("\n🔴 Recording Demo...")
-        confirm = input("Start a 5-second test recording? (y/n): ").lower()
+        # Read the answer in a worker thread so the event loop isn't blocked meanwhile
+        confirm = (await loop.run_in_executor(None, input, "Start a 5-second test recording? (y/n): ")).lower()
 
         if confirm == "y":
             print("🔴 Recording started...")
@@ -105,11 +113,13 @@ async def run_demo():
             output_path = await agent.stop_recording()
             print(f"✅ Recording saved to: {output_path}")
 
-        print("\n✨ Demo Complete!")
-        print("You can now:")
-        print("- Use the examples.py file for more demos")
-        print("- Try the CrewAI agents for autonomous control")
-        print("- Build your own automations!")
+        print(
+            "\n✨ Demo Complete!\n"
+            "You can now:\n"
+            "- Use the examples.py file for more demos\n"
+            "- Try the CrewAI agents for autonomous control\n"
+            "- Build your own automations!"
+        )
 
     except Exception as e:
         print(f"\n❌ Error: {str(e)}")
@@ -119,4 +129,10 @@ async def run_demo():
 
 
 if __name__ == "__main__":
-    asyncio.run(run_demo())
+    # Use uvloop's faster event loop when it is installed
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_demo())
+    else:
+        uvloop.run(run_demo())
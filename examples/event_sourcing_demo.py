@@ -11,6 +11,8 @@ This example demonstrates:
 """
 
 import asyncio
+import sys
+import traceback
 from datetime import datetime, timedelta
 from pathlib import Path
 
@@ -18,12 +20,31 @@ from obs_agent import OBSAgent, Config
 from obs_agent.events import (
     EventSourcingSystem,
     EventSourcingConfig,
+    EventType,
     SwitchScene,
     GetCurrentScene,
     GetEventHistory,
+    SceneSwitched,
 )
 
 
+class DebugPrinter:
+    """Collect output lines and write them to stdout in one call on exit."""
+
+    def __enter__(self):
+        self._lines = []
+        return self
+
+    def line(self, text=""):
+        self._lines.append(text)
+
+    def __exit__(self, *exc_info):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+        return False
+
+
 async def demo_event_sourcing():
     """Demonstrate event sourcing capabilities."""
     
@@ -59,22 +80,20 @@ async def demo_event_sourcing():
         print("1. BASIC EVENT SOURCING")
         print("=" * 40)
         
-        # Start a correlation for user interaction
-        correlation_id = event_system.start_correlation()
-        print(f"\n🔗 Started correlation: {correlation_id}")
-        
-        # Perform some operations
-        scenes = await agent.scenes.get_scene_list()
-        print(f"\n📋 Available scenes: {scenes}")
+        # Group the user interaction under one correlation (ended even on errors)
+        with event_system.correlation() as correlation_id:
+            print(f"\n🔗 Started correlation: {correlation_id}")
         
-        if len(scenes) >= 2:
-            # Switch between scenes
-            for scene in scenes[:2]:
-                print(f"\n🎬 Switching to scene: {scene}")
-                await agent.scenes.switch_scene(scene)
-                await asyncio.sleep(1)
+            # Perform some operations
+            scenes = await agent.scenes.get_scene_list()
+            print(f"\n📋 Available scenes: {scenes}")
         
-        event_system.end_correlation()
+            if len(scenes) >= 2:
+                # Switch between scenes
+                for scene in scenes[:2]:
+                    print(f"\n🎬 Switching to scene: {scene}")
+                    await agent.scenes.switch_scene(scene)
+                    await asyncio.sleep(1)
         
         # ========================================
         # 2. Query Event History
@@ -90,10 +109,11 @@ async def demo_event_sourcing():
         )
         recent_events = await event_system.query_bus.send(history_query)
         
-        print(f"\n📜 Recent events ({len(recent_events)} total):")
-        for event in recent_events:
-            print(f"  - {event['event_type']}: {event['aggregate_id']}")
-            print(f"    Time: {event['metadata']['timestamp']}")
+        with DebugPrinter() as dp:
+            dp.line(f"\n📜 Recent events ({len(recent_events)} total):")
+            for event in recent_events:
+                dp.line(f"  - {event['event_type']}: {event['aggregate_id']}")
+                dp.line(f"    Time: {event['metadata']['timestamp']}")
         
         # ========================================
         # 3. Projections and Read Models
@@ -116,9 +136,10 @@ async def demo_event_sourcing():
             # Query performance projection
             event_counts = event_system.query_projection("performance", "event_counts_by_type")
             if event_counts:
-                print(f"\n📈 Event Type Distribution:")
-                for event_type, count in list(event_counts.items())[:5]:
-                    print(f"  {event_type}: {count}")
+                with DebugPrinter() as dp:
+                    dp.line(f"\n📈 Event Type Distribution:")
+                    for event_type, count in list(event_counts.items())[:5]:
+                        dp.line(f"  {event_type}: {count}")
         
         # ========================================
         # 4. Time-Travel Debugging
@@ -134,13 +155,14 @@ async def demo_event_sourcing():
             print(f"   Events in range: {len(session.events_in_range)}")
             
             # Step through events
-            print("\n⏭️  Stepping forward through events:")
-            for _ in range(min(3, len(session.events_in_range))):
-                events, state = event_system.debugger.step_forward()
-                if events:
-                    event = events[0]
-                    print(f"  Event: {event.event_type.value}")
-                    print(f"  State: Scene={state['current_scene']}, Streaming={state['is_streaming']}")
+            with DebugPrinter() as dp:
+                dp.line("\n⏭️  Stepping forward through events:")
+                for _ in range(min(3, len(session.events_in_range))):
+                    events, state = event_system.debugger.step_forward()
+                    if events:
+                        event = events[0]
+                        dp.line(f"  Event: {event.event_type.value}")
+                        dp.line(f"  State: Scene={state['current_scene']}, Streaming={state['is_streaming']}")
             
             # Step backward
             print("\n⏮️  Stepping backward:")
@@ -150,7 +172,7 @@ async def demo_event_sourcing():
             
             # Set a breakpoint
             def scene_switch_condition(event):
-                return event.event_type.value == "scene.switched"
+                return event.event_type == EventType.SCENE_SWITCHED
             
             try:
                 breakpoint = event_system.debugger.set_breakpoint(scene_switch_condition)
@@ -176,23 +198,20 @@ async def demo_event_sourcing():
             # Run a what-if scenario
             def modify_events(events):
                 """What if we had switched to a different scene?"""
-                modified = events.copy()
-                
-                # Find scene switch events and modify them
-                for i, event in enumerate(modified):
-                    if event.event_type.value == "scene.switched":
+                # Find scene switch events and patch the first one; the other
+                # events are shared with the debug session, not copied
+                for i, event in enumerate(events):
+                    if event.event_type == EventType.SCENE_SWITCHED:
                         # Create a modified event
-                        from obs_agent.events.domain import SceneSwitched
-                        new_event = SceneSwitched(
+                        events[i] = SceneSwitched(
                             aggregate_id=event.aggregate_id,
                             metadata=event.metadata,
-                            from_scene=event.get_event_data()["from_scene"],
+                            from_scene=event.data["from_scene"],
                             to_scene="What-If Scene"  # Different scene
                         )
-                        modified[i] = new_event
                         break
                 
-                return modified
+                return events
             
             what_if_state = event_system.debugger.what_if(modify_events)
             print(f"\n🤔 What-If Analysis:")
@@ -233,20 +252,16 @@ async def demo_event_sourcing():
         print("7. EVENT EXPORT")
         print("=" * 40)
         
-        # Export recent events
-        export_json = event_system.export_events(
+        # Export recent events straight to a file
+        export_path = Path.home() / ".obs_agent" / "event_export.json"
+        exported = event_system.export_events_to_file(
+            export_path,
             format="json",
             since=datetime.utcnow() - timedelta(minutes=5)
         )
         
-        import json
-        export_data = json.loads(export_json)
-        print(f"\n💾 Exported {export_data['event_count']} events")
-        print(f"   Export size: {len(export_json)} bytes")
-        
-        # Save to file
-        export_path = Path.home() / ".obs_agent" / "event_export.json"
-        export_path.write_text(export_json)
+        print(f"\n💾 Exported {exported} events")
+        print(f"   Export size: {export_path.stat().st_size} bytes")
         print(f"   Saved to: {export_path}")
         
         # ========================================
@@ -263,17 +278,18 @@ async def demo_event_sourcing():
         print(f"  Event types: {stats['event_types']}")
         
         if 'projections' in stats:
-            print(f"\n  Projections:")
-            for name, version in stats['projections'].items():
-                print(f"    {name}: v{version}")
+            with DebugPrinter() as dp:
+                dp.line(f"\n  Projections:")
+                for name, version in stats['projections'].items():
+                    dp.line(f"    {name}: v{version}")
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
-        import traceback
         traceback.print_exc()
     
     finally:
         # Clean up
+        await event_system.flush()
         await event_system.stop()
         await agent.disconnect()
         print("\n✅ Demo completed!")
@@ -306,8 +322,6 @@ async def demo_advanced_debugging():
             print(f"   Total events: {len(session.events_in_range)}")
             
             # Find patterns
-            from obs_agent.events.domain import EventType
-            
             pattern = [
                 EventType.SCENE_SWITCHED,
                 EventType.STREAM_STARTED
@@ -321,10 +335,11 @@ async def demo_advanced_debugging():
             print(f"\n🔎 Found {len(matches)} instances of pattern:")
             print(f"   Scene Switch → Stream Start (within 10 seconds)")
             
-            for match in matches[:3]:  # Show first 3
-                print(f"\n   Match at {match[0].metadata.timestamp}:")
-                for event in match:
-                    print(f"     - {event.event_type.value}")
+            with DebugPrinter() as dp:
+                for match in matches[:3]:  # Show first 3
+                    dp.line(f"\n   Match at {match[0].metadata.timestamp}:")
+                    for event in match:
+                        dp.line(f"     - {event.event_type.value}")
             
             # Analyze causation chains
             if session.events_in_range:
@@ -335,9 +350,10 @@ async def demo_advanced_debugging():
                         chain = event_system.debugger.analyze_causation_chain(
                             event.metadata.event_id
                         )
-                        print(f"   Caused {len(chain)} downstream events:")
-                        for caused_event in chain[:5]:
-                            print(f"     → {caused_event.event_type.value}")
+                        with DebugPrinter() as dp:
+                            dp.line(f"   Caused {len(chain)} downstream events:")
+                            for caused_event in chain[:5]:
+                                dp.line(f"     → {caused_event.event_type.value}")
                         break
             
             # Export debugging session
@@ -345,6 +361,7 @@ async def demo_advanced_debugging():
             print(f"\n💾 Exported debug session ({len(session_export)} bytes)")
     
     finally:
+        await event_system.flush()
         await event_system.stop()
         print("\n✅ Advanced debugging completed!")
 
@@ -0,0 +1,32 @@
+"""
+Helpers shared by the example scripts.
+
+The examples are run as scripts (python examples/<name>.py), so they import
+this module from their own directory.
+"""
+
+import asyncio
+import signal
+
+
+async def wait_for_stop(stop, timeout):
+    """Wait until stop is set (Ctrl+C / SIGTERM set it) or timeout seconds pass.
+
+    Returns True if the wait ended because of a stop request.
+    """
+    loop = asyncio.get_running_loop()
+    signals = (signal.SIGINT, signal.SIGTERM)
+    try:
+        for sig in signals:
+            loop.add_signal_handler(sig, stop.set)
+    except NotImplementedError:
+        # Windows event loops have no signal handlers; Ctrl+C still raises KeyboardInterrupt
+        signals = ()
+    try:
+        await asyncio.wait_for(stop.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+    finally:
+        for sig in signals:
+            loop.remove_signal_handler(sig)
+    return stop.is_set()
@@ -7,11 +7,37 @@ from obs_agent import OBSAgent, OBSController
 
 load_dotenv()
 
+PASSWORD = os.getenv("OBS_WEBSOCKET_PASSWORD", "")
+
+# One OBS connection shared by every example run in this process. main() runs a
+# single example per process, so it only saves reconnecting when the examples are
+# imported and run one after another (e.g. from a REPL).
+_agent = None
+
+
+async def get_agent():
+    """Return the shared connected agent, connecting on first use (None if OBS is unreachable)"""
+    global _agent
+    if _agent is None or not _agent.connected:
+        agent = OBSAgent(host="localhost", port=4455, password=PASSWORD)
+        if not await agent.connect():
+            return None
+        _agent = agent
+    return _agent
+
+
+def close_agent():
+    """Disconnect the shared agent, if one is connected"""
+    global _agent
+    if _agent is not None:
+        agent, _agent = _agent, None
+        agent.disconnect()
+
 
 async def basic_usage_example():
-    agent = OBSAgent(host="localhost", port=4455, password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         version = await agent.get_version()
         print(f"OBS Version: {version['obs_version']}")
         print(f"WebSocket Version: {version['websocket_version']}")
@@ -25,13 +51,11 @@ async def basic_usage_example():
         sources = await agent.get_sources()
         print(f"\nAvailable sources: {[s['inputName'] for s in sources]}")
 
-        agent.disconnect()
-
 
 async def recording_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         print("Starting recording...")
         await agent.start_recording()
 
@@ -43,13 +67,11 @@ async def recording_example():
         output_path = await agent.stop_recording()
         print(f"Recording saved to: {output_path}")
 
-        agent.disconnect()
-
 
 async def scene_switching_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         scenes = await agent.get_scenes()
         print(f"Available scenes: {scenes}")
 
@@ -58,13 +80,11 @@ async def scene_switching_example():
             await agent.set_scene(scene)
             await asyncio.sleep(3)
 
-        agent.disconnect()
-
 
 async def audio_control_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         sources = await agent.get_sources()
         audio_sources = [s for s in sources if "Audio" in s.get("inputKind", "")]
 
@@ -84,14 +104,12 @@ async def audio_control_example():
             await agent.toggle_source_mute(source_name)
             print("Toggled mute state")
 
-        agent.disconnect()
-
 
 async def streaming_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
-    controller = OBSController(agent)
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
+        controller = OBSController(agent)
 
         def alert_callback(message):
             print(f"ALERT: {message}")
@@ -110,27 +128,24 @@ async def streaming_example():
         print("Stream stopped")
 
         monitor_task.cancel()
-        agent.disconnect()
 
 
 async def automated_recording_session():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
-    controller = OBSController(agent)
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
+        controller = OBSController(agent)
         scenes = await agent.get_scenes()
 
         print("Starting automated recording session...")
         output_path = await controller.create_recording_session(scenes=scenes[:3], duration_per_scene=5)
         print(f"Recording saved to: {output_path}")
 
-        agent.disconnect()
-
 
 async def create_source_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         current_scene = await agent.get_current_scene()
 
         text_settings = {"text": "Hello from OBS Agent!", "font": {"face": "Arial", "size": 72}, "color": 0xFFFFFF}
@@ -148,25 +163,21 @@ async def create_source_example():
             await agent.remove_source("Test Text Source")
             print("Removed text source")
 
-        agent.disconnect()
-
 
 async def backup_restore_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
-    controller = OBSController(agent)
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
+        controller = OBSController(agent)
         print("Backing up OBS scenes...")
         backup_path = await controller.backup_scenes("obs_backup.json")
         print(f"Backup saved to: {backup_path}")
 
-        agent.disconnect()
-
 
 async def transition_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         transitions = await agent.get_transitions()
         print(f"Available transitions: {transitions}")
 
@@ -180,13 +191,11 @@ async def transition_example():
             await asyncio.sleep(2)
             await agent.set_scene(scenes[1])
 
-        agent.disconnect()
-
 
 async def screenshot_example():
-    agent = OBSAgent(password=os.getenv("OBS_WEBSOCKET_PASSWORD", ""))
+    agent = await get_agent()
 
-    if await agent.connect():
+    if agent:
         sources = await agent.get_sources()
         if sources:
             source_name = sources[0]["inputName"]
@@ -199,8 +208,6 @@ async def screenshot_example():
             if success:
                 print(f"Screenshot saved: {screenshot_path}")
 
-        agent.disconnect()
-
 
 async def main():
     print("OBS Agent Examples")
@@ -232,7 +239,10 @@ async def main():
     }
 
     if choice in examples:
-        await examples[choice]()
+        try:
+            await examples[choice]()
+        finally:
+            close_agent()
     else:
         print("Invalid choice")
 
@@ -87,6 +87,14 @@ setup(
             "numpy>=1.24.0",
             "pandas>=2.0.0",
         ],
+        "uvloop": [
+            # Faster asyncio event loop for the example scripts (not available on Windows)
+            "uvloop>=0.18.0; sys_platform != 'win32'",
+        ],
+        "orjson": [
+            # Faster JSON for event exports and the obs-websocket client
+            "orjson>=3.9.0",
+        ],
         "full": [
             # All optional dependencies for complete functionality
             "crewai>=0.22.0",
@@ -101,6 +109,8 @@ setup(
             "discord.py>=2.3.0",
             "numpy>=1.24.0",
             "pandas>=2.0.0",
+            "uvloop>=0.18.0; sys_platform != 'win32'",
+            "orjson>=3.9.0",
         ],
     },
     entry_points={
@@ -286,6 +286,10 @@ class ChatIntelligenceIntegration:
     def get_chat_stats(self) -> Dict[str, Any]:
         """Get current chat statistics."""
         return self.chat_service.get_stats()
+
+    async def wait_idle(self, quiet_period: float = 5.0) -> None:
+        """Wait until the chat has been quiet for quiet_period seconds."""
+        await self.chat_service.wait_idle(quiet_period)
     
     def configure_thresholds(self, **thresholds) -> None:
         """Configure automation thresholds."""
@@ -9,7 +9,7 @@ except ImportError:
     AdvancedOBSAgent = None  # type: ignore
     AdvancedOBSController = None  # type: ignore
 from .config import Config, LoggingConfig, OBSConfig, StreamingConfig, get_config, set_config
-from .connection import ConnectionManager, get_connection_manager, obs_connection
+from .connection import ConnectionManager, get_connection_manager, obs_connection, use_orjson
 
 # Event system
 from .event_handler import (  # Event classes; Middleware
@@ -103,6 +103,7 @@ __all__ = [
     "ConnectionManager",
     "get_connection_manager",
     "obs_connection",
+    "use_orjson",
     # Exceptions
     "OBSAgentError",
     "ConnectionError",
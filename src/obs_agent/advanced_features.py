@@ -1,7 +1,7 @@
 import asyncio
 import logging
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Tuple
 
 from obswebsocket import requests
 
@@ -254,6 +254,26 @@ class AdvancedOBSAgent(OBSAgent):
             self.logger.error(f"Failed to set output settings: {e}")
             return False
 
+    async def batch(self, batch: List[Dict[str, Any]], halt_on_failure: bool = False) -> bool:
+        """Run OBS v5 RequestBatch entries ({"requestType", "requestData"}) in order.
+
+        obs-websocket-py has no RequestBatch transport, so the requests are issued
+        back to back over the open connection without yielding in between.
+        Returns True if every request that ran succeeded.
+        """
+        ok = True
+        try:
+            for item in batch:
+                request = getattr(requests, item["requestType"])(**item.get("requestData", {}))
+                if not self._ws.call(request).status:
+                    ok = False
+                    if halt_on_failure:
+                        break
+            return ok
+        except Exception as e:
+            self.logger.error(f"Failed to run request batch: {e}")
+            return False
+
 
 class AdvancedOBSController:
     def __init__(self, agent: AdvancedOBSAgent):
@@ -387,25 +407,39 @@ class AdvancedOBSController:
         end_time = datetime.now() + timedelta(seconds=duration_seconds)
 
         while datetime.now() < end_time:
-            sources = await self.agent.get_sources()
-            audio_sources = [s for s in sources if "Audio" in s.get("inputKind", "")]
-
-            for source in audio_sources:
-                source_name = source["inputName"]
-                volume = await self.agent.get_source_volume(source_name)
-                current_db = volume["volume_db"]
-
-                if current_db < target_range[0]:
-                    new_db = target_range[0]
-                    await self.agent.set_source_volume(source_name, volume_db=new_db)
-                    self.logger.info(f"Boosted {source_name} to {new_db} dB")
-                elif current_db > target_range[1]:
-                    new_db = target_range[1]
-                    await self.agent.set_source_volume(source_name, volume_db=new_db)
-                    self.logger.info(f"Reduced {source_name} to {new_db} dB")
-
+            await self._adjust_audio_levels(target_range)
             await asyncio.sleep(2)
 
+    async def monitor_audio_until_cancelled(
+        self, target_range_provider: Callable[[], Tuple[float, float]], interval: float = 2.0
+    ) -> None:
+        """Keep audio sources inside a target range until the task is cancelled.
+
+        target_range_provider is called before every pass, so one long-lived monitor
+        can follow range changes (e.g. per scene) without being restarted.
+        """
+        while True:
+            await self._adjust_audio_levels(target_range_provider())
+            await asyncio.sleep(interval)
+
+    async def _adjust_audio_levels(self, target_range: Tuple[float, float]) -> None:
+        sources = await self.agent.get_sources()
+        audio_sources = [s for s in sources if "Audio" in s.get("inputKind", "")]
+
+        for source in audio_sources:
+            source_name = source["inputName"]
+            volume = await self.agent.get_source_volume(source_name)
+            current_db = volume["volume_db"]
+
+            if current_db < target_range[0]:
+                new_db = target_range[0]
+                await self.agent.set_source_volume(source_name, volume_db=new_db)
+                self.logger.info(f"Boosted {source_name} to {new_db} dB")
+            elif current_db > target_range[1]:
+                new_db = target_range[1]
+                await self.agent.set_source_volume(source_name, volume_db=new_db)
+                self.logger.info(f"Reduced {source_name} to {new_db} dB")
+
     async def create_highlight_reel(self, clips: List[Dict[str, Any]]) -> str:
         await self.agent.start_recording()
 
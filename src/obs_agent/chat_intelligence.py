@@ -215,6 +215,9 @@ class ChatIntelligenceEngine:
         self.engagement_history: List[float] = []
         self.running = False
         
+        # Set on every processed message; created lazily by wait_idle
+        self.activity: Optional[asyncio.Event] = None
+
         # Simple sentiment keywords (will be replaced with proper NLP)
         self.positive_keywords = {
             'love', 'awesome', 'great', 'amazing', 'fantastic', 'perfect',
@@ -346,6 +349,9 @@ class ChatIntelligenceEngine:
         # Check for engagement moments
         await self._check_engagement_moments()
         
+        if self.activity is not None:
+            self.activity.set()
+
         logger.info(
             f"Processed message from {message.username}: "
             f"sentiment={analysis.sentiment_score:.2f}, "
@@ -1092,6 +1098,23 @@ class ChatIntelligenceService:
         
         logger.info("Chat intelligence service stopped")
     
+    async def wait_idle(self, quiet_period: float = 5.0) -> None:
+        """Wait until no chat message has been processed for quiet_period seconds.
+
+        Returns straight away if the service is not running.
+        """
+
+        engine = self.intelligence_engine
+        if engine.activity is None:
+            engine.activity = asyncio.Event()
+
+        while self.running:
+            engine.activity.clear()
+            try:
+                await asyncio.wait_for(engine.activity.wait(), timeout=quiet_period)
+            except asyncio.TimeoutError:
+                return
+
     def get_stats(self) -> Dict[str, Any]:
         """Get service statistics."""
         
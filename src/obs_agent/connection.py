@@ -13,8 +13,10 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from threading import Lock
+from types import SimpleNamespace
 from typing import Any, Callable, Optional
 
+import obswebsocket.core
 import obswebsocket.exceptions
 from obswebsocket import obsws, requests
 
@@ -395,6 +397,26 @@ def get_connection_manager() -> ConnectionManager:
     return _connection_manager
 
 
+def use_orjson() -> bool:
+    """
+    Make obs-websocket-py encode and decode its messages with orjson.
+
+    The client builds every request payload with json.dumps, and again for its
+    debug log; orjson does the same work several times faster. Nothing changes
+    when orjson is not installed.
+
+    Returns:
+        True if orjson is now in use
+    """
+    try:
+        import orjson
+    except ImportError:
+        return False
+
+    obswebsocket.core.json = SimpleNamespace(loads=orjson.loads, dumps=lambda obj, **kwargs: orjson.dumps(obj).decode())
+    return True
+
+
 @asynccontextmanager
 async def obs_connection(config: Optional[OBSConfig] = None):
     """
@@ -55,6 +55,7 @@ from .store import (
 )
 from .time_travel import (
     DebugSession,
+    EventOverlay,
     TimePoint,
     TimeTravelDebugger,
 )
@@ -92,6 +93,7 @@ __all__ = [
     "TimeTravelDebugger",
     "TimePoint",
     "DebugSession",
+    "EventOverlay",
     # Projections
     "Projection",
     "ProjectionState",
@@ -11,7 +11,7 @@ from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional, Type, Union
 from uuid import UUID, uuid4
 
-from .domain import DomainEvent, EventMetadata, SceneSwitched, StreamStarted
+from .domain import DomainEvent, EventMetadata, EventType, SceneSwitched, StreamStarted
 from .store import EventStore
 
 
@@ -244,7 +244,7 @@ class StartStreamHandler(CommandHandler):
             if isinstance(event, StreamStarted):
                 is_streaming = True
                 break
-            elif event.event_type.value == "stream.stopped":
+            elif event.event_type == EventType.STREAM_STOPPED:
                 is_streaming = False
                 break
 
@@ -306,10 +306,9 @@ class GetEventHistoryHandler(QueryHandler):
     async def handle(self, query: Query) -> Any:
         """Get event history."""
         assert isinstance(query, GetEventHistory)  # Type narrowing for MyPy
-        events = self.event_store.replay_events(aggregate_id=query.aggregate_id, since=query.since, until=query.until)
-
-        if query.limit:
-            events = events[: query.limit]
+        events = self.event_store.replay_events(
+            aggregate_id=query.aggregate_id, since=query.since, until=query.until, limit=query.limit or None
+        )
 
         return [event.to_dict() for event in events]
 
@@ -452,10 +451,10 @@ class ReadModel:
             self._current_scene = event.to_scene
         elif isinstance(event, StreamStarted):
             self._is_streaming = True
-        elif event.event_type.value == "stream.stopped":
+        elif event.event_type == EventType.STREAM_STOPPED:
             self._is_streaming = False
-        elif event.event_type.value == "scene.created":
-            scene_name = event.get_event_data().get("scene_name")
+        elif event.event_type == EventType.SCENE_CREATED:
+            scene_name = event.data.get("scene_name")
             if scene_name and scene_name not in self._scenes:
                 self._scenes.append(scene_name)
 
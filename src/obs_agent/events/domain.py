@@ -10,6 +10,7 @@ from abc import ABC, abstractmethod
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Dict, List, Optional, Type
 from uuid import UUID, uuid4
 
@@ -108,6 +109,16 @@ class DomainEvent(ABC):
         """Return the event-specific data."""
         pass
 
+    @cached_property
+    def data(self) -> Dict[str, Any]:
+        """
+        The event-specific data, built once per event.
+
+        Events are immutable, so read-only consumers such as projections and
+        replays share this dict instead of rebuilding it on every access.
+        """
+        return self.get_event_data()
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert event to dictionary for storage."""
         return {
@@ -6,12 +6,21 @@ and the existing OBS Agent functionality.
 """
 
 import asyncio
+import csv
+import io
+import json
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, List, Optional, Union
 from uuid import UUID, uuid4
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore
+
 if TYPE_CHECKING:
     from ..obs_agent_v2 import OBSAgent
 
@@ -44,6 +53,8 @@ class EventSourcingConfig:
     projection_update_interval: float = 1.0
     enable_time_travel: bool = True
     persist_events: bool = True
+    write_batch_size: int = 100  # Events persisted per transaction
+    write_flush_delay: float = 0.05  # Seconds an appended event may wait before being persisted
 
 
 class EventSourcingSystem:
@@ -79,8 +90,9 @@ class EventSourcingSystem:
         else:
             self.debugger = None
 
-        # Current correlation context
+        # Current correlation context, plus one stack entry of buffered events per open correlation
         self._current_correlation_id: Optional[UUID] = None
+        self._correlation_stack: List[Optional[UUID]] = []  # Enclosing correlation ids
 
         # Hook into OBS Agent operations
         self._setup_interceptors()
@@ -239,17 +251,45 @@ class EventSourcingSystem:
         Start a new correlation context.
 
         All events created until end_correlation() will share
-        the same correlation ID.
+        the same correlation ID, and are persisted together when it ends.
         """
+        self._correlation_stack.append(self._current_correlation_id)
         self._current_correlation_id = uuid4()
+        self.event_store.hold_writes()
         return self._current_correlation_id
 
     def end_correlation(self) -> None:
-        """End the current correlation context."""
-        self._current_correlation_id = None
+        """End the current correlation context and persist its events in one batch."""
+        if not self._correlation_stack:
+            self._current_correlation_id = None
+            return
+
+        self._current_correlation_id = self._correlation_stack.pop()
+        self.event_store.release_writes()
+
+    @contextmanager
+    def correlation(self) -> Iterator[UUID]:
+        """
+        Run a block in its own correlation context.
+
+        The context is ended even if the block raises, so its events are
+        always persisted.
+
+        Usage:
+            with event_system.correlation() as correlation_id:
+                await agent.scenes.switch_scene("Main")
+        """
+        correlation_id = self.start_correlation()
+        try:
+            yield correlation_id
+        finally:
+            self.end_correlation()
 
     async def start(self) -> None:
         """Start the event sourcing system."""
+        # Batch event writes instead of committing one transaction per event
+        self.event_store.start_write_behind(self.config.write_batch_size, self.config.write_flush_delay)
+
         # Start projection updates if enabled
         if self.projection_builder and self.config.enable_projections:
             await self.projection_builder.start_continuous_update(self.config.projection_update_interval)
@@ -260,6 +300,12 @@ class EventSourcingSystem:
         if self.projection_builder:
             await self.projection_builder.stop_continuous_update()
 
+        await self.event_store.stop_write_behind()
+
+    async def flush(self) -> None:
+        """Persist every event appended so far."""
+        self.event_store.flush()
+
     def get_statistics(self) -> Dict[str, Any]:
         """Get event sourcing statistics."""
         stats = {
@@ -344,8 +390,6 @@ class EventSourcingSystem:
         events = self.event_store.replay_events(since=since, until=until)
 
         if format == "json":
-            import json
-
             data = {
                 "export_time": datetime.utcnow().isoformat(),
                 "event_count": len(events),
@@ -353,28 +397,75 @@ class EventSourcingSystem:
             }
             return json.dumps(data, indent=2, default=str)
         elif format == "csv":
-            import csv
-            import io
-
             output = io.StringIO()
             writer = csv.writer(output)
 
             # Header
-            writer.writerow(["timestamp", "event_type", "aggregate_id", "event_id", "correlation_id", "data"])
+            writer.writerow(_CSV_HEADER)
 
             # Events
-            for event in events:
-                writer.writerow(
-                    [
-                        event.metadata.timestamp.isoformat(),
-                        event.event_type.value,
-                        event.aggregate_id,
-                        str(event.metadata.event_id),
-                        str(event.metadata.correlation_id) if event.metadata.correlation_id else "",
-                        json.dumps(event.get_event_data()),
-                    ]
-                )
+            writer.writerows(_csv_row(event) for event in events)
 
             return output.getvalue()
         else:
             raise ValueError(f"Unsupported format: {format}")
+
+    def export_events_to_file(
+        self,
+        path: Union[str, Path],
+        format: str = "json",
+        since: Optional[datetime] = None,
+        until: Optional[datetime] = None,
+    ) -> int:
+        """
+        Export events straight to a file, one event at a time.
+
+        Unlike export_events(), the export is never held in memory as a single
+        string. Uses orjson for the JSON encoding when it is installed.
+
+        Returns the number of events exported.
+        """
+        events = self.event_store.replay_events(since=since, until=until)
+
+        if format == "json":
+            with open(path, "wb") as f:
+                header = {"export_time": datetime.utcnow().isoformat(), "event_count": len(events)}
+                # Reopen the header object to append the events array
+                f.write(_dumps(header)[:-1] + b',"events":[')
+                for i, event in enumerate(events):
+                    if i:
+                        f.write(b",")
+                    f.write(_dumps(event.to_dict()))
+                f.write(b"]}")
+        elif format == "csv":
+            with open(path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.writer(f)
+                writer.writerow(_CSV_HEADER)
+                writer.writerows(_csv_row(event) for event in events)
+        else:
+            raise ValueError(f"Unsupported format: {format}")
+
+        return len(events)
+
+
+_CSV_HEADER = ["timestamp", "event_type", "aggregate_id", "event_id", "correlation_id", "data"]
+
+
+def _csv_row(event: DomainEvent) -> List[str]:
+    """Return the CSV export columns for an event."""
+    return [
+        event.metadata.timestamp.isoformat(),
+        event.event_type.value,
+        event.aggregate_id,
+        str(event.metadata.event_id),
+        str(event.metadata.correlation_id) if event.metadata.correlation_id else "",
+        json.dumps(event.data),
+    ]
+
+
+def _dumps(obj: Any) -> bytes:
+    """Encode obj as compact UTF-8 JSON, stringifying anything JSON has no type for."""
+    if orjson is not None:
+        # Pass datetimes through to default=str so both encoders render them the same way
+        return orjson.dumps(obj, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.dumps(obj, default=str, separators=(",", ":"), ensure_ascii=False).encode()
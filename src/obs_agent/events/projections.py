@@ -5,7 +5,6 @@ This module provides a framework for creating projections that transform
 the event stream into optimized read models for different use cases.
 """
 
-import asyncio
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
@@ -113,13 +112,13 @@ class SceneProjection(Projection[Dict[str, Any]]):
 
     def handle_event(self, event: DomainEvent) -> None:
         if event.event_type == EventType.SCENE_CREATED:
-            data = event.get_event_data()
+            data = event.data
             scene_name = data["scene_name"]
             if scene_name not in self.state["scenes"]:
                 self.state["scenes"].append(scene_name)
 
         elif event.event_type == EventType.SCENE_SWITCHED:
-            data = event.get_event_data()
+            data = event.data
 
             # Update scene tracking
             self.state["previous_scene"] = self.state["current_scene"]
@@ -128,17 +127,19 @@ class SceneProjection(Projection[Dict[str, Any]]):
 
             # Track duration in previous scene
             if self.state["last_switch_time"] and self.state["previous_scene"]:
-                duration = (event.metadata.timestamp - self.state["last_switch_time"]).total_seconds()
-                self.state["scene_durations"][self.state["previous_scene"]] += duration
+                previous_scene = self.state["previous_scene"]
+                durations = self.state["scene_durations"]
+                durations[previous_scene] += (event.metadata.timestamp - self.state["last_switch_time"]).total_seconds()
 
-            self.state["last_switch_time"] = event.metadata.timestamp
+                # Only the previous scene's total grew, so it is the only possible new leader
+                most_used = self.state["most_used_scene"]
+                if most_used is None or durations[previous_scene] > durations[most_used]:
+                    self.state["most_used_scene"] = previous_scene
 
-            # Update most used scene
-            if self.state["scene_durations"]:
-                self.state["most_used_scene"] = max(self.state["scene_durations"].items(), key=lambda x: x[1])[0]
+            self.state["last_switch_time"] = event.metadata.timestamp
 
         elif event.event_type == EventType.SCENE_DELETED:
-            data = event.get_event_data()
+            data = event.data
             scene_name = data.get("scene_name")
             if scene_name in self.state["scenes"]:
                 self.state["scenes"].remove(scene_name)
@@ -168,7 +169,7 @@ class StreamingProjection(Projection[Dict[str, Any]]):
             self.state["stream_count"] += 1
 
         elif event.event_type == EventType.STREAM_STOPPED:
-            data = event.get_event_data()
+            data = event.data
 
             self.state["is_streaming"] = False
 
@@ -215,6 +216,7 @@ class AutomationProjection(Projection[Dict[str, Any]]):
             "rules": {},
             "total_executions": 0,
             "total_failures": 0,
+            "total_execution_time": 0,
             "average_execution_time": 0,
             "most_triggered_rule": None,
             "recent_executions": [],
@@ -222,7 +224,7 @@ class AutomationProjection(Projection[Dict[str, Any]]):
 
     def handle_event(self, event: DomainEvent) -> None:
         if event.event_type == EventType.AUTOMATION_RULE_CREATED:
-            data = event.get_event_data()
+            data = event.data
             rule_id = data.get("rule_id")
             if rule_id:
                 self.state["rules"][rule_id] = {
@@ -235,13 +237,13 @@ class AutomationProjection(Projection[Dict[str, Any]]):
                 }
 
         elif event.event_type == EventType.AUTOMATION_RULE_TRIGGERED:
-            data = event.get_event_data()
+            data = event.data
             rule_id = data["rule_id"]
             if rule_id in self.state["rules"]:
                 self.state["rules"][rule_id]["trigger_count"] += 1
 
         elif event.event_type == EventType.AUTOMATION_RULE_EXECUTED:
-            data = event.get_event_data()
+            data = event.data
             rule_id = data["rule_id"]
 
             self.state["total_executions"] += 1
@@ -250,10 +252,11 @@ class AutomationProjection(Projection[Dict[str, Any]]):
                 rule = self.state["rules"][rule_id]
                 rule["execution_count"] += 1
                 rule["total_execution_time"] += data["execution_time_ms"]
+                self.state["total_execution_time"] += data["execution_time_ms"]
 
-            # Update average execution time
-            total_time = sum(r["total_execution_time"] for r in self.state["rules"].values())
+            # Update average execution time from the running total
             if self.state["total_executions"] > 0:
+                total_time = self.state["total_execution_time"]
                 self.state["average_execution_time"] = total_time / self.state["total_executions"]
 
             # Track most triggered rule
@@ -278,7 +281,7 @@ class AutomationProjection(Projection[Dict[str, Any]]):
                 self.state["recent_executions"] = self.state["recent_executions"][-50:]
 
         elif event.event_type == EventType.AUTOMATION_RULE_FAILED:
-            data = event.get_event_data()
+            data = event.data
             rule_id = data.get("rule_id")
 
             self.state["total_failures"] += 1
@@ -309,10 +312,11 @@ class PerformanceProjection(Projection[Dict[str, Any]]):
         hour = event.metadata.timestamp.hour
         self.state["time_windows"]["hourly"][hour] += 1
 
-        # Find busiest hour
-        if self.state["time_windows"]["hourly"]:
-            busiest = max(self.state["time_windows"]["hourly"].items(), key=lambda x: x[1])
-            self.state["busiest_hour"] = busiest[0]
+        # Find busiest hour; only this event's hour changed
+        hourly = self.state["time_windows"]["hourly"]
+        busiest = self.state["busiest_hour"]
+        if busiest is None or hourly[hour] > hourly[busiest]:
+            self.state["busiest_hour"] = hour
 
         # Track errors and warnings
         if event.event_type == EventType.SYSTEM_ERROR:
@@ -339,7 +343,6 @@ class ProjectionBuilder:
         self.event_store = event_store
         self.projections: Dict[str, Projection] = {}
         self._running = False
-        self._update_task: Optional[asyncio.Task] = None
 
         # Register default projections
         self._register_default_projections()
@@ -399,31 +402,18 @@ class ProjectionBuilder:
         return None
 
     async def start_continuous_update(self, interval: float = 1.0) -> None:
-        """Start continuous projection updates."""
-        self._running = True
-        self._update_task = asyncio.create_task(self._continuous_update_loop(interval))
-
-    async def _continuous_update_loop(self, interval: float) -> None:
-        """Continuously update projections."""
-        last_update = datetime.utcnow()
-
-        while self._running:
-            # Get new events since last update
-            events = self.event_store.replay_events(since=last_update)
-
-            # Apply to all projections
-            for event in events:
-                for projection in self.projections.values():
-                    projection.apply(event)
+        """
+        Start continuous projection updates.
 
-            last_update = datetime.utcnow()
-            await asyncio.sleep(interval)
+        Projections are maintained incrementally: every appended event is applied
+        to each projection as it is stored, so there is no stream to re-scan and
+        `interval` is only kept for API compatibility.
+        """
+        self._running = True
 
     async def stop_continuous_update(self) -> None:
         """Stop continuous updates."""
         self._running = False
-        if self._update_task:
-            await self._update_task
 
     def get_all_states(self) -> Dict[str, ProjectionState]:
         """Get states of all projections."""
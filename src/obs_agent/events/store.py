@@ -11,17 +11,29 @@ This module provides an append-only event store with support for:
 
 import asyncio
 import json
+import logging
 import sqlite3
 import threading
-from collections import defaultdict
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import islice
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Set, Tuple, Type
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Type
 from uuid import UUID
 
 from .domain import DomainEvent, EventMetadata, EventType
 
+logger = logging.getLogger(__name__)
+
+# Multi-row INSERTs stay under SQLite's default limit of 999 bound parameters
+_ROW_PLACEHOLDERS = "(?, ?, ?, ?, ?, ?, ?, ?)"
+_ROWS_PER_INSERT = 999 // 8
+
+# Rows queued under hold_writes() are written early past this, so a hold never buffers without bound
+_MAX_HELD_ROWS = 10_000
+
 
 @dataclass
 class EventStream:
@@ -90,10 +102,26 @@ class EventStore:
         # Thread-safe access
         self._lock = threading.RLock()
 
+        # One connection for the store's lifetime; transactions are managed explicitly
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA busy_timeout=5000")
+
+        # Write-behind buffer of event rows waiting to be persisted
+        self._pending_rows: List[Tuple[Any, ...]] = []
+        self._max_batch_size = 1
+        self._flush_delay = 0.0
+        self._flush_wakeup: Optional[asyncio.Event] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        self._write_holds = 0  # Open hold_writes() calls; appends only queue while > 0
+
         # In-memory indices for fast queries
         self._events_by_aggregate: Dict[str, List[DomainEvent]] = defaultdict(list)
         self._events_by_type: Dict[EventType, List[DomainEvent]] = defaultdict(list)
         self._global_event_stream: List[DomainEvent] = []
+        self._events_by_causation: Dict[UUID, List[DomainEvent]] = defaultdict(list)
         self._snapshots: Dict[str, List[Snapshot]] = defaultdict(list)
 
         # Event subscriptions
@@ -106,7 +134,7 @@ class EventStore:
 
     def _init_db(self):
         """Initialize SQLite database."""
-        with sqlite3.connect(str(self.db_path)) as conn:
+        with self._transaction() as conn:
             conn.execute(
                 """
                 CREATE TABLE IF NOT EXISTS events (
@@ -165,22 +193,36 @@ class EventStore:
             """
             )
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run a block of statements in one write transaction on the store's connection."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
     def close(self):
         """Close the event store and clean up resources."""
-        # Force close any remaining SQLite connections
-        # This helps with Windows file locking issues
-        import gc
+        if self._writer_task:
+            self._writer_task.cancel()
+            self._writer_task = None
+        self.flush()
 
-        gc.collect()
+        # Closing the connection releases the database files (needed for Windows file locking)
+        with self._lock:
+            self._conn.close()
 
     def _load_events(self):
         """Load all events from database into memory."""
-        with sqlite3.connect(str(self.db_path)) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._conn.execute(
                 """
                 SELECT event_data FROM events 
-                ORDER BY created_at, version
+                ORDER BY created_at, version, rowid
             """
             )
 
@@ -189,9 +231,7 @@ class EventStore:
                 event = DomainEvent.from_dict(event_data)
 
                 # Update in-memory indices
-                self._events_by_aggregate[event.aggregate_id].append(event)
-                self._events_by_type[event.event_type].append(event)
-                self._global_event_stream.append(event)
+                self._index_event(event)
 
     def append(self, event: DomainEvent) -> None:
         """
@@ -200,35 +240,171 @@ class EventStore:
         This is the only way to modify state in an event-sourced system.
         """
         with self._lock:
-            # Persist to database
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.execute(
-                    """
-                    INSERT INTO events (
-                        event_id, aggregate_id, event_type, event_data,
-                        timestamp, version, correlation_id, causation_id
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        str(event.metadata.event_id),
-                        event.aggregate_id,
-                        event.event_type.value,
-                        event.to_json(),
-                        event.metadata.timestamp.isoformat(),
-                        event.metadata.version,
-                        str(event.metadata.correlation_id) if event.metadata.correlation_id else None,
-                        str(event.metadata.causation_id) if event.metadata.causation_id else None,
-                    ),
-                )
+            # Queue for persistence; written immediately unless write-behind is running
+            self._pending_rows.append(self._event_row(event))
+            self._write_queued(1)
 
             # Update in-memory indices
-            self._events_by_aggregate[event.aggregate_id].append(event)
-            self._events_by_type[event.event_type].append(event)
-            self._global_event_stream.append(event)
+            self._index_event(event)
 
             # Notify subscribers
             self._notify_subscribers(event)
 
+    def _write_queued(self, added: int) -> None:
+        """Persist queued rows as the current write mode requires after `added` new ones."""
+        if self._write_holds:
+            # Written together by the last release_writes(), unless the hold grows too large
+            if len(self._pending_rows) >= _MAX_HELD_ROWS:
+                self._try_flush()
+        elif self._writer_task is None:
+            try:
+                self.flush()
+            except BaseException:
+                # Without a background writer the append fails as a whole
+                del self._pending_rows[-added:]
+                raise
+        elif len(self._pending_rows) >= self._max_batch_size:
+            self._try_flush()
+        elif self._flush_wakeup:
+            self._flush_wakeup.set()
+
+    def hold_writes(self) -> None:
+        """
+        Hold back database writes until the matching release_writes().
+
+        Events appended meanwhile are indexed and published as usual; only
+        their rows are queued, to be persisted in one transaction. The hold
+        covers the whole store, so events appended by other tasks while it is
+        open are held too. A hold that queues more than _MAX_HELD_ROWS rows is
+        written early, splitting it over several transactions.
+        """
+        with self._lock:
+            self._write_holds += 1
+
+    def release_writes(self) -> None:
+        """Release one hold_writes(); the last release persists the queued events."""
+        with self._lock:
+            if not self._write_holds:
+                return
+            self._write_holds -= 1
+            if self._write_holds:
+                return
+
+            if self._writer_task is None:
+                self.flush()
+            else:
+                self._try_flush()
+
+    def append_batch(self, events: List[DomainEvent]) -> None:
+        """
+        Append several events at once.
+
+        The events are queued together, so they are persisted in the same
+        transaction, then indexed and published in order.
+        """
+        if not events:
+            return
+
+        with self._lock:
+            self._pending_rows.extend(self._event_row(event) for event in events)
+            self._write_queued(len(events))
+
+            for event in events:
+                self._index_event(event)
+
+            for event in events:
+                self._notify_subscribers(event)
+
+    @staticmethod
+    def _event_row(event: DomainEvent) -> Tuple[Any, ...]:
+        """Column values for an event's row in the events table."""
+        return (
+            str(event.metadata.event_id),
+            event.aggregate_id,
+            event.event_type.value,
+            event.to_json(),
+            event.metadata.timestamp.isoformat(),
+            event.metadata.version,
+            str(event.metadata.correlation_id) if event.metadata.correlation_id else None,
+            str(event.metadata.causation_id) if event.metadata.causation_id else None,
+        )
+
+    def _index_event(self, event: DomainEvent) -> None:
+        """Add an event to the in-memory indices."""
+        self._events_by_aggregate[event.aggregate_id].append(event)
+        self._events_by_type[event.event_type].append(event)
+        self._global_event_stream.append(event)
+        if event.metadata.causation_id:
+            self._events_by_causation[event.metadata.causation_id].append(event)
+
+    def flush(self) -> None:
+        """Persist all buffered events in a single transaction of multi-row INSERTs."""
+        with self._lock:
+            rows = self._pending_rows
+            if not rows:
+                return
+
+            # The rows stay queued until the transaction commits, so a failed
+            # write is retried by the next flush instead of being dropped
+            with self._transaction() as conn:
+                for i in range(0, len(rows), _ROWS_PER_INSERT):
+                    chunk = rows[i : i + _ROWS_PER_INSERT]
+                    conn.execute(
+                        f"""
+                        INSERT INTO events (
+                            event_id, aggregate_id, event_type, event_data,
+                            timestamp, version, correlation_id, causation_id
+                        ) VALUES {", ".join([_ROW_PLACEHOLDERS] * len(chunk))}
+                    """,
+                        [value for row in chunk for value in row],
+                    )
+            self._pending_rows = []
+
+    def _try_flush(self) -> None:
+        """Flush for the background writer, logging a failure instead of raising it."""
+        try:
+            self.flush()
+        except sqlite3.Error:
+            logger.exception("Event persistence failed; %d events kept for retry", len(self._pending_rows))
+
+    def start_write_behind(self, max_batch_size: int = 100, max_flush_delay: float = 0.05) -> None:
+        """
+        Persist appended events in batches from a background task.
+
+        Events are still indexed and published as soon as they are appended;
+        only the database write is deferred. A batch is written once it holds
+        max_batch_size events or max_flush_delay seconds after its first event,
+        whichever comes first. Must be called from a running event loop.
+        """
+        if self._writer_task:
+            return
+
+        self._max_batch_size = max_batch_size
+        self._flush_delay = max_flush_delay
+        self._flush_wakeup = asyncio.Event()
+        self._writer_task = asyncio.create_task(self._write_behind_loop())
+
+    async def stop_write_behind(self) -> None:
+        """Stop the background writer and persist anything still buffered."""
+        if self._writer_task:
+            self._writer_task.cancel()
+            try:
+                await self._writer_task
+            except asyncio.CancelledError:
+                pass
+            self._writer_task = None
+
+        self.flush()
+
+    async def _write_behind_loop(self) -> None:
+        """Flush the buffer whenever new events have been waiting for the flush delay."""
+        assert self._flush_wakeup is not None  # Set in start_write_behind()
+        while True:
+            await self._flush_wakeup.wait()
+            await asyncio.sleep(self._flush_delay)
+            self._flush_wakeup.clear()
+            self._try_flush()
+
     def _notify_subscribers(self, event: DomainEvent):
         """Notify all subscribers of a new event."""
         for subscriber in self._subscribers:
@@ -285,30 +461,35 @@ class EventStore:
         since: Optional[datetime] = None,
         until: Optional[datetime] = None,
         event_types: Optional[Set[EventType]] = None,
+        limit: Optional[int] = None,
     ) -> List[DomainEvent]:
         """
         Replay events with various filters.
 
+        Filters are applied lazily in a single pass, so with a limit the scan
+        stops as soon as enough matching events have been found.
+
         This is the core of time-travel debugging.
         """
         with self._lock:
+            matching: Iterable[DomainEvent]
             if aggregate_id:
-                events = self._events_by_aggregate.get(aggregate_id, [])
+                matching = self._events_by_aggregate.get(aggregate_id, [])
             else:
-                events = self._global_event_stream.copy()
+                matching = self._global_event_stream
 
             # Apply time filters
             if since:
-                events = [e for e in events if e.metadata.timestamp >= since]
+                matching = (e for e in matching if e.metadata.timestamp >= since)
 
             if until:
-                events = [e for e in events if e.metadata.timestamp <= until]
+                matching = (e for e in matching if e.metadata.timestamp <= until)
 
             # Apply type filter
             if event_types:
-                events = [e for e in events if e.event_type in event_types]
+                matching = (e for e in matching if e.event_type in event_types)
 
-            return events
+            return list(islice(matching, limit))
 
     def get_aggregate_version(self, aggregate_id: str) -> int:
         """Get the current version of an aggregate."""
@@ -319,7 +500,7 @@ class EventStore:
     def save_snapshot(self, snapshot: Snapshot) -> None:
         """Save a snapshot for an aggregate."""
         with self._lock:
-            with sqlite3.connect(str(self.db_path)) as conn:
+            with self._transaction() as conn:
                 conn.execute(
                     """
                     INSERT OR REPLACE INTO snapshots (
@@ -344,28 +525,26 @@ class EventStore:
                 return max(snapshots, key=lambda s: s.version)
 
             # Try loading from database
-            with sqlite3.connect(str(self.db_path)) as conn:
-                conn.row_factory = sqlite3.Row
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM snapshots 
-                    WHERE aggregate_id = ? 
-                    ORDER BY version DESC 
-                    LIMIT 1
-                """,
-                    (aggregate_id,),
-                )
+            cursor = self._conn.execute(
+                """
+                SELECT * FROM snapshots
+                WHERE aggregate_id = ?
+                ORDER BY version DESC
+                LIMIT 1
+            """,
+                (aggregate_id,),
+            )
 
-                row = cursor.fetchone()
-                if row:
-                    snapshot = Snapshot(
-                        aggregate_id=row["aggregate_id"],
-                        version=row["version"],
-                        timestamp=datetime.fromisoformat(row["timestamp"]),
-                        state=json.loads(row["state"]),
-                    )
-                    self._snapshots[aggregate_id].append(snapshot)
-                    return snapshot
+            row = cursor.fetchone()
+            if row:
+                snapshot = Snapshot(
+                    aggregate_id=row["aggregate_id"],
+                    version=row["version"],
+                    timestamp=datetime.fromisoformat(row["timestamp"]),
+                    state=json.loads(row["state"]),
+                )
+                self._snapshots[aggregate_id].append(snapshot)
+                return snapshot
 
             return None
 
@@ -419,20 +598,20 @@ class EventStore:
         """Get all events caused by a specific event."""
         with self._lock:
             chain = []
-            to_process = [event_id]
+            to_process = deque([event_id])
             processed = set()
 
+            # Breadth-first walk over the causation index; each hop is a dict lookup
             while to_process:
-                current_id = to_process.pop(0)
+                current_id = to_process.popleft()
                 if current_id in processed:
                     continue
 
                 processed.add(current_id)
 
-                for event in self._global_event_stream:
-                    if event.metadata.causation_id == current_id:
-                        chain.append(event)
-                        to_process.append(event.metadata.event_id)
+                for event in self._events_by_causation.get(current_id, ()):
+                    chain.append(event)
+                    to_process.append(event.metadata.event_id)
 
             return chain
 
@@ -472,6 +651,7 @@ class EventStore:
         """Rebuild in-memory indices from aggregate events."""
         self._events_by_type.clear()
         self._global_event_stream.clear()
+        self._events_by_causation.clear()
 
         for events in self._events_by_aggregate.values():
             for event in events:
@@ -480,3 +660,7 @@ class EventStore:
 
         # Sort global stream by timestamp
         self._global_event_stream.sort(key=lambda e: e.metadata.timestamp)
+
+        for event in self._global_event_stream:
+            if event.metadata.causation_id:
+                self._events_by_causation[event.metadata.causation_id].append(event)
@@ -6,9 +6,13 @@ at any point in time, and debug automation rules with perfect reproducibility.
 """
 
 import asyncio
+import bisect
+import math
+import pickle
+from collections import abc
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
 from uuid import UUID, uuid4
 
 from .domain import DomainEvent, EventType
@@ -42,6 +46,107 @@ class DebugSession:
     watch_expressions: Dict[str, Callable] = field(default_factory=dict)
 
 
+class EventOverlay(abc.MutableSequence):
+    """
+    A copy-on-write variant of an event sequence.
+
+    Reads fall through to the base sequence except where `patches` maps an
+    index to a replacement event, so many what-if branches can share one list.
+    Assigning an item just records a patch. Changes that shift positions
+    (insert, append, delete, slice assignment) first copy the events into a
+    private list, after which the overlay behaves like a plain list.
+    """
+
+    def __init__(
+        self,
+        base: Sequence[DomainEvent],
+        patches: Optional[Dict[int, DomainEvent]] = None,
+        length: Optional[int] = None,
+    ):
+        self.base = base
+        self.patches: Dict[int, DomainEvent] = patches if patches is not None else {}
+        self._length = len(base) if length is None else length
+        self._items: Optional[List[DomainEvent]] = None
+
+    @property
+    def copied(self) -> bool:
+        """Whether the overlay has been copied into its own list."""
+        return self._items is not None
+
+    def _own_items(self) -> List[DomainEvent]:
+        """Copy the patched events into a private list on the first structural change."""
+        if self._items is None:
+            self._items = [self.patches.get(i, self.base[i]) for i in range(self._length)]
+        return self._items
+
+    def _position(self, index: int) -> int:
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("event index out of range")
+        return index
+
+    def __len__(self) -> int:
+        return self._length if self._items is None else len(self._items)
+
+    def __getitem__(self, index):
+        if self._items is not None:
+            return self._items[index]
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._length))]
+        index = self._position(index)
+        return self.patches.get(index, self.base[index])
+
+    def __setitem__(self, index, value):
+        if self._items is None and not isinstance(index, slice):
+            self.patches[self._position(index)] = value
+        else:
+            self._own_items()[index] = value
+
+    def __delitem__(self, index):
+        del self._own_items()[index]
+
+    def insert(self, index: int, value: DomainEvent) -> None:
+        self._own_items().insert(index, value)
+
+    def copy(self) -> List[DomainEvent]:
+        """Return the events as a new list, like list.copy()."""
+        return list(self)
+
+
+class SnapshotRing:
+    """
+    Sparse full-state snapshots of a debug session.
+
+    A snapshot is kept every `interval` events, so rebuilding the state after
+    any event only needs to replay the events since the nearest snapshot.
+    """
+
+    def __init__(self, interval: int):
+        self.interval = max(1, interval)
+        self._indices: List[int] = []
+        self._states: List[bytes] = []
+
+    def add(self, event_index: int, state: Dict[str, Any]) -> None:
+        """Record the state after `event_index` events if it falls on the snapshot interval."""
+        if event_index % self.interval:
+            return
+
+        position = bisect.bisect_left(self._indices, event_index)
+        if position < len(self._indices) and self._indices[position] == event_index:
+            return
+
+        self._indices.insert(position, event_index)
+        self._states.insert(position, pickle.dumps(state, pickle.HIGHEST_PROTOCOL))
+
+    def nearest(self, event_index: int) -> Tuple[int, Optional[Dict[str, Any]]]:
+        """Return the latest snapshot at or before `event_index` as (index, state copy)."""
+        position = bisect.bisect_right(self._indices, event_index) - 1
+        if position < 0:
+            return 0, None
+        return self._indices[position], pickle.loads(self._states[position])
+
+
 class TimeTravelDebugger:
     """
     Time-travel debugger for event-sourced systems.
@@ -60,6 +165,8 @@ class TimeTravelDebugger:
         self.current_session: Optional[DebugSession] = None
         self._projections: Dict[str, Projection] = {}
         self._state_cache: Dict[datetime, Dict[str, Any]] = {}
+        self._timestamps: List[datetime] = []
+        self._snapshots = SnapshotRing(1)
 
     def start_session(self, start_time: Optional[datetime] = None, end_time: Optional[datetime] = None) -> DebugSession:
         """Start a new debugging session."""
@@ -69,8 +176,8 @@ class TimeTravelDebugger:
         if not start_time:
             start_time = end_time - timedelta(hours=24)
 
-        # Get events in range
-        events = self.event_store.replay_events(since=start_time, until=end_time)
+        # Get events in range, in timeline order
+        events = sorted(self.event_store.replay_events(since=start_time, until=end_time), key=_event_time)
 
         session = DebugSession(
             session_id=uuid4(),
@@ -81,6 +188,10 @@ class TimeTravelDebugger:
         )
 
         self.current_session = session
+        self._state_cache.clear()
+        self._timestamps = [e.metadata.timestamp for e in events]
+        # Snapshot spacing of ~sqrt(N) balances snapshot memory against replay length
+        self._snapshots = SnapshotRing(math.isqrt(len(events)))
         return session
 
     def goto(self, timestamp: datetime) -> Dict[str, Any]:
@@ -96,11 +207,8 @@ class TimeTravelDebugger:
         if timestamp in self._state_cache:
             return self._state_cache[timestamp]
 
-        # Replay events up to timestamp
-        events = [e for e in self.current_session.events_in_range if e.metadata.timestamp <= timestamp]
-
-        # Build state from events
-        state = self._build_state_from_events(events)
+        # Rebuild state from the nearest snapshot before timestamp
+        state = self._state_at_index(bisect.bisect_right(self._timestamps, timestamp))
 
         # Cache for faster access
         self._state_cache[timestamp] = state
@@ -119,16 +227,14 @@ class TimeTravelDebugger:
         if not self.current_session:
             raise ValueError("No active debugging session")
 
-        current_pos = self.current_session.current_position
-
-        # Find next events
-        future_events = [e for e in self.current_session.events_in_range if e.metadata.timestamp > current_pos]
-
-        if not future_events:
-            return [], self.goto(current_pos)
+        events = self.current_session.events_in_range
+        position = bisect.bisect_right(self._timestamps, self.current_session.current_position)
 
         # Take the next 'count' events
-        next_events = future_events[:count]
+        next_events = events[position : position + count]
+
+        if not next_events:
+            return [], self.goto(self.current_session.current_position)
 
         # Move to timestamp of last event
         new_position = next_events[-1].metadata.timestamp
@@ -145,20 +251,17 @@ class TimeTravelDebugger:
         if not self.current_session:
             raise ValueError("No active debugging session")
 
-        current_pos = self.current_session.current_position
-
-        # Find previous events
-        past_events = [e for e in self.current_session.events_in_range if e.metadata.timestamp <= current_pos]
+        events = self.current_session.events_in_range
+        position = bisect.bisect_right(self._timestamps, self.current_session.current_position)
 
-        if len(past_events) <= count:
+        if position <= count:
             # Go to beginning
-            undone_events = past_events
+            undone_events = events[:position]
             state = self.goto(self.current_session.start_time)
         else:
             # Remove last 'count' events
-            undone_events = past_events[-count:]
-            remaining_events = past_events[:-count]
-            new_position = remaining_events[-1].metadata.timestamp
+            undone_events = events[position - count : position]
+            new_position = events[position - count - 1].metadata.timestamp
             state = self.goto(new_position)
 
         return undone_events, state
@@ -227,11 +330,19 @@ class TimeTravelDebugger:
         return self.event_store.get_correlation_chain(correlation_id)
 
     def what_if(
-        self, modify_events: Callable[[List[DomainEvent]], List[DomainEvent]], at_timestamp: Optional[datetime] = None
+        self,
+        modify_events: Callable[["EventOverlay"], Sequence[DomainEvent]],
+        at_timestamp: Optional[datetime] = None,
     ) -> Dict[str, Any]:
         """
         Run a what-if scenario by modifying the event stream.
 
+        modify_events receives the session's events up to the timestamp as an
+        EventOverlay, which supports the usual list operations. Replacing events
+        by index and returning the overlay shares the unmodified events with the
+        session instead of copying them; the callback may also return any other
+        sequence of events.
+
         This doesn't affect the actual event store, only the debugging session.
         """
         if not self.current_session:
@@ -240,14 +351,28 @@ class TimeTravelDebugger:
         timestamp = at_timestamp or self.current_session.current_position
 
         # Get events up to timestamp
-        events = [e for e in self.current_session.events_in_range if e.metadata.timestamp <= timestamp]
+        overlay = EventOverlay(
+            self.current_session.events_in_range, length=bisect.bisect_right(self._timestamps, timestamp)
+        )
 
         # Apply modifications
-        modified_events = modify_events(events)
+        modified_events = modify_events(overlay)
+
+        if modified_events is not overlay or overlay.copied:
+            # Build state from modified events
+            return self._build_state_from_events(modified_events)
+
+        # Everything before the first patch matches the session, so fork from its nearest snapshot
+        first_patch = min(overlay.patches, default=len(overlay))
+        index, state = self._snapshots.nearest(first_patch)
+        if state is None:
+            state = self._initial_state()
 
-        # Build state from modified events
-        state = self._build_state_from_events(modified_events)
+        for i in range(index, len(overlay)):
+            self._apply_event(state, overlay[i])
 
+        state["event_count"] = len(overlay)
+        state["last_event"] = overlay[-1].to_dict() if len(overlay) else None
         return state
 
     def find_event_pattern(
@@ -261,22 +386,33 @@ class TimeTravelDebugger:
         if not self.current_session:
             raise ValueError("No active debugging session")
 
-        matches = []
+        matches: List[List[DomainEvent]] = []
         events = self.current_session.events_in_range
+        if not pattern:
+            return matches
 
-        for i in range(len(events) - len(pattern) + 1):
-            candidate = events[i : i + len(pattern)]
+        # Single pass over the event types with a KMP automaton: on a mismatch the
+        # failure table says how much of the pattern is still matched, so no event
+        # is compared more than a constant number of times on average
+        failure = _failure_table(pattern)
+        matched = 0
+
+        for i, event in enumerate(events):
+            event_type = event.event_type
+            while matched and event_type != pattern[matched]:
+                matched = failure[matched - 1]
+            if event_type == pattern[matched]:
+                matched += 1
+
+            if matched == len(pattern):
+                candidate = events[i - matched + 1 : i + 1]
 
-            # Check if types match
-            if all(e.event_type == p for e, p in zip(candidate, pattern)):
                 # Check timing constraint if specified
-                if within:
-                    time_span = candidate[-1].metadata.timestamp - candidate[0].metadata.timestamp
-                    if time_span <= within:
-                        matches.append(candidate)
-                else:
+                if not within or candidate[-1].metadata.timestamp - candidate[0].metadata.timestamp <= within:
                     matches.append(candidate)
 
+                matched = failure[matched - 1]
+
         return matches
 
     def get_statistics(self) -> Dict[str, Any]:
@@ -286,11 +422,12 @@ class TimeTravelDebugger:
 
         events = self.current_session.events_in_range
 
-        # Count events by type
-        event_counts: Dict[str, int] = {}
+        # Count events by type, keyed by member and only rendered as strings once
+        type_counts: Dict[EventType, int] = {}
         for event in events:
-            event_type = event.event_type.value
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
+            event_type = event.event_type
+            type_counts[event_type] = type_counts.get(event_type, 0) + 1
+        event_counts = {event_type.value: count for event_type, count in type_counts.items()}
 
         # Find most active aggregates
         aggregate_counts: Dict[str, int] = {}
@@ -339,40 +476,88 @@ class TimeTravelDebugger:
         else:
             raise ValueError(f"Unsupported format: {format}")
 
-    def _build_state_from_events(self, events: List[DomainEvent]) -> Dict[str, Any]:
+    def _state_at_index(self, event_index: int) -> Dict[str, Any]:
+        """Build the state after the first `event_index` session events, starting from the nearest snapshot."""
+        assert self.current_session is not None  # Checked by callers
+        events = self.current_session.events_in_range
+
+        index, state = self._snapshots.nearest(event_index)
+        if state is None:
+            state = self._initial_state()
+
+        for event in events[index:event_index]:
+            self._apply_event(state, event)
+            index += 1
+            self._snapshots.add(index, state)
+
+        state["event_count"] = event_index
+        state["last_event"] = events[event_index - 1].to_dict() if event_index else None
+        return state
+
+    def _build_state_from_events(self, events: Sequence[DomainEvent]) -> Dict[str, Any]:
         """Build system state from a list of events."""
-        state: Dict[str, Any] = {
+        state = self._initial_state()
+
+        # Apply each event to build state
+        for event in events:
+            self._apply_event(state, event)
+
+        state["event_count"] = len(events)
+        state["last_event"] = events[-1].to_dict() if events else None
+        return state
+
+    @staticmethod
+    def _initial_state() -> Dict[str, Any]:
+        """Return the system state before any event."""
+        return {
             "current_scene": "Unknown",
             "is_streaming": False,
             "is_recording": False,
             "scenes": [],
             "sources": {},
             "automation_rules": {},
-            "event_count": len(events),
-            "last_event": events[-1].to_dict() if events else None,
+            "event_count": 0,
+            "last_event": None,
         }
 
-        # Apply each event to build state
-        for event in events:
-            if event.event_type == EventType.SCENE_SWITCHED:
-                state["current_scene"] = event.get_event_data()["to_scene"]
-            elif event.event_type == EventType.SCENE_CREATED:
-                scene_name = event.get_event_data()["scene_name"]
-                if scene_name not in state["scenes"]:
-                    state["scenes"].append(scene_name)
-            elif event.event_type == EventType.STREAM_STARTED:
-                state["is_streaming"] = True
-            elif event.event_type == EventType.STREAM_STOPPED:
-                state["is_streaming"] = False
-            elif event.event_type == EventType.RECORDING_STARTED:
-                state["is_recording"] = True
-            elif event.event_type == EventType.RECORDING_STOPPED:
-                state["is_recording"] = False
-            elif event.event_type == EventType.SOURCE_CREATED:
-                data = event.get_event_data()
-                state["sources"][data["source_name"]] = {
-                    "type": data["source_type"],
-                    "settings": data["source_settings"],
-                }
+    @staticmethod
+    def _apply_event(state: Dict[str, Any], event: DomainEvent) -> None:
+        """Apply a single event to the system state."""
+        if event.event_type == EventType.SCENE_SWITCHED:
+            state["current_scene"] = event.data["to_scene"]
+        elif event.event_type == EventType.SCENE_CREATED:
+            scene_name = event.data["scene_name"]
+            if scene_name not in state["scenes"]:
+                state["scenes"].append(scene_name)
+        elif event.event_type == EventType.STREAM_STARTED:
+            state["is_streaming"] = True
+        elif event.event_type == EventType.STREAM_STOPPED:
+            state["is_streaming"] = False
+        elif event.event_type == EventType.RECORDING_STARTED:
+            state["is_recording"] = True
+        elif event.event_type == EventType.RECORDING_STOPPED:
+            state["is_recording"] = False
+        elif event.event_type == EventType.SOURCE_CREATED:
+            data = event.data
+            state["sources"][data["source_name"]] = {
+                "type": data["source_type"],
+                "settings": data["source_settings"],
+            }
 
-        return state
+
+def _failure_table(pattern: Sequence[EventType]) -> List[int]:
+    """KMP failure table: length of the longest proper prefix of pattern[:i + 1] that is also its suffix."""
+    failure = [0] * len(pattern)
+    length = 0
+    for i in range(1, len(pattern)):
+        while length and pattern[i] != pattern[length]:
+            length = failure[length - 1]
+        if pattern[i] == pattern[length]:
+            length += 1
+        failure[i] = length
+    return failure
+
+
+def _event_time(event: DomainEvent) -> datetime:
+    """Sort key ordering events by timestamp."""
+    return event.metadata.timestamp
@@ -6,10 +6,11 @@ Tests domain events, event store, CQRS, projections, and time-travel debugging.
 
 import asyncio
 import json
+import sqlite3
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 from uuid import UUID, uuid4
 
 import pytest
@@ -37,6 +38,7 @@ from obs_agent.events.domain import (
     StreamStarted,
     StreamStopped,
 )
+from obs_agent.events.integration import EventSourcingConfig, EventSourcingSystem
 from obs_agent.events.projections import (
     AutomationProjection,
     PerformanceProjection,
@@ -92,6 +94,12 @@ class TestDomainEvents:
         assert event.transition_type == "fade"
         assert event.transition_duration == 500
 
+    def test_event_data_is_cached(self):
+        """Test that event data is built once per event."""
+        event = SceneSwitched(aggregate_id="obs_system", from_scene="Scene1", to_scene="Scene2")
+        assert event.data == event.get_event_data()
+        assert event.data is event.data
+
     def test_event_serialization(self):
         """Test event serialization to JSON."""
         event = StreamStarted(aggregate_id="stream", stream_settings={"bitrate": 5000}, service="twitch")
@@ -177,6 +185,16 @@ class TestEventStore:
         assert len(recent_events) == 1
         assert recent_events[0].scene_name == "Current Scene"
 
+    def test_replay_events_with_limit(self, event_store):
+        """Test that a limit returns the earliest matching events."""
+        for i in range(5):
+            event_store.append(SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}"))
+            event_store.append(StreamStarted(aggregate_id="stream", service="twitch"))
+
+        events = event_store.replay_events(event_types={EventType.SCENE_CREATED}, limit=2)
+        assert [e.scene_name for e in events] == ["Scene 0", "Scene 1"]
+        assert len(event_store.replay_events(limit=None)) == 10
+
     def test_snapshots(self, event_store):
         """Test snapshot functionality."""
         snapshot = Snapshot("test_agg", version=10, timestamp=datetime.utcnow(), state={"counter": 42, "name": "test"})
@@ -228,6 +246,52 @@ class TestEventStore:
         assert len(chain) == 3
         assert all(e.metadata.correlation_id == correlation_id for e in chain)
 
+    def test_causation_chain(self, event_store):
+        """Test following causation links across several hops."""
+        root = AutomationRuleTriggered("rule:1", rule_id="rule1", rule_name="Rule", trigger_type="manual")
+        child = SceneSwitched(
+            "obs_system", metadata=EventMetadata(causation_id=root.metadata.event_id), from_scene="A", to_scene="B"
+        )
+        grandchild = StreamStarted("stream", metadata=EventMetadata(causation_id=child.metadata.event_id))
+        for event in (root, child, SceneCreated(aggregate_id="scene:other", scene_name="Other"), grandchild):
+            event_store.append(event)
+
+        assert event_store.get_causation_chain(root.metadata.event_id) == [child, grandchild]
+        assert event_store.get_causation_chain(grandchild.metadata.event_id) == []
+
+    def test_append_batch(self, event_store):
+        """Test appending a batch larger than one multi-row INSERT."""
+        received_events = []
+        event_store.subscribe(received_events.append)
+
+        events = [SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}") for i in range(300)]
+        event_store.append_batch(events)
+
+        assert event_store.replay_events() == events
+        assert received_events == events
+        assert event_store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 300
+
+    def test_held_writes_flushed_past_limit(self, event_store):
+        """Test that a write hold is persisted early once it queues too many rows."""
+
+        def persisted():
+            return event_store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+        with patch("obs_agent.events.store._MAX_HELD_ROWS", 3):
+            event_store.hold_writes()
+            for i in range(2):
+                event_store.append(SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}"))
+            assert persisted() == 0
+
+            event_store.append(SceneCreated(aggregate_id="scene:2", scene_name="Scene 2"))
+            assert persisted() == 3
+
+            event_store.append(SceneCreated(aggregate_id="scene:3", scene_name="Scene 3"))
+            assert persisted() == 3
+            event_store.release_writes()
+
+        assert persisted() == 4
+
 
 class TestCQRS:
     """Test CQRS implementation."""
@@ -316,6 +380,75 @@ class TestCQRS:
         assert events[0].metadata.user_id == "test_user"
 
 
+class TestEventSourcingSystem:
+    """Test the OBS Agent integration."""
+
+    @pytest.fixture
+    def event_system(self):
+        """Create an event sourcing system around a mocked agent."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            agent = MagicMock()
+            agent.scenes.switch_scene = AsyncMock()
+            agent.scenes.get_current_scene = AsyncMock(return_value="Start")
+            system = EventSourcingSystem(agent, EventSourcingConfig(db_path=Path(tmpdir) / "test_events.db"))
+            yield agent, system
+            system.event_store.close()
+
+    @pytest.mark.asyncio
+    async def test_correlation_events_stored_together(self, event_system):
+        """Test that events inside a correlation are visible at once and persisted when it ends."""
+        agent, system = event_system
+        store = system.event_store
+
+        def persisted():
+            return store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+        with system.correlation() as correlation_id:
+            await agent.scenes.switch_scene("Scene 1")
+            await agent.scenes.switch_scene("Scene 2")
+
+            # Indexed and published right away, written when the correlation ends
+            events = store.get_events("obs_system")
+            assert [e.to_scene for e in events] == ["Scene 1", "Scene 2"]
+            assert all(e.metadata.correlation_id == correlation_id for e in events)
+            assert persisted() == 0
+
+        assert persisted() == 2
+
+        # Outside a correlation events are persisted immediately
+        await agent.scenes.switch_scene("Scene 3")
+        assert persisted() == 3
+
+    @pytest.mark.asyncio
+    async def test_correlation_ends_when_block_raises(self, event_system):
+        """Test that a failing correlation block still persists its events."""
+        agent, system = event_system
+
+        with pytest.raises(RuntimeError):
+            with system.correlation():
+                await agent.scenes.switch_scene("Scene 1")
+                raise RuntimeError("boom")
+
+        assert system._current_correlation_id is None
+        assert system.event_store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 1
+
+    def test_export_events_to_file(self, event_system, tmp_path):
+        """Test streaming an export to disk."""
+        agent, system = event_system
+        for i in range(3):
+            system.event_store.append(SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}"))
+
+        json_path = tmp_path / "export.json"
+        assert system.export_events_to_file(json_path) == 3
+        data = json.loads(json_path.read_text(encoding="utf-8"))
+        assert data["event_count"] == 3
+        assert data["events"] == json.loads(system.export_events())["events"]
+
+        csv_path = tmp_path / "export.csv"
+        assert system.export_events_to_file(csv_path, format="csv") == 3
+        assert csv_path.read_bytes().decode("utf-8") == system.export_events(format="csv")
+
+
 class TestProjections:
     """Test event projections."""
 
@@ -499,6 +632,33 @@ class TestTimeTravelDebugger:
         assert len(undone) == 1
         assert state["event_count"] == 1
 
+    def test_step_backward_from_snapshots(self, debugger_setup):
+        """Test that snapshot-based stepping matches a full replay."""
+        event_store, debugger = debugger_setup
+
+        start = datetime.utcnow() - timedelta(minutes=10)
+        for i in range(50):
+            event_store.append(
+                SceneSwitched(
+                    "obs_system",
+                    metadata=EventMetadata(timestamp=start + timedelta(seconds=i)),
+                    from_scene=f"Scene {i - 1}",
+                    to_scene=f"Scene {i}",
+                )
+            )
+
+        session = debugger.start_session()
+        debugger.step_forward(40)
+
+        undone, state = debugger.step_backward(15)
+        assert len(undone) == 15
+        assert state == debugger._build_state_from_events(session.events_in_range[:25])
+        assert state["current_scene"] == "Scene 24"
+
+        undone, state = debugger.step_backward(30)
+        assert len(undone) == 25
+        assert state["event_count"] == 0
+
     def test_set_breakpoint(self, debugger_setup):
         """Test setting breakpoints."""
         event_store, debugger = debugger_setup
@@ -558,6 +718,77 @@ class TestTimeTravelDebugger:
         ), f"No modified SceneSwitched event found. Events: {[type(e).__name__ for e in modified]}"
         assert state["current_scene"] == "Alternative Scene"
 
+    def test_what_if_with_overlay(self, debugger_setup):
+        """Test what-if scenarios that patch the session events in place."""
+        event_store, debugger = debugger_setup
+
+        start = datetime.utcnow() - timedelta(minutes=10)
+        for i in range(20):
+            event_store.append(
+                SceneSwitched(
+                    "obs_system",
+                    metadata=EventMetadata(timestamp=start + timedelta(seconds=i)),
+                    from_scene=f"Scene {i - 1}",
+                    to_scene=f"Scene {i}",
+                )
+            )
+
+        session = debugger.start_session()
+        debugger.step_forward(20)
+
+        def modify_events(events):
+            events.patches[19] = SceneSwitched("obs_system", from_scene="Scene 18", to_scene="Alternative Scene")
+            return events
+
+        state = debugger.what_if(modify_events)
+        assert state["current_scene"] == "Alternative Scene"
+        assert state["event_count"] == 20
+
+        # The session itself is untouched
+        assert session.events_in_range[19].to_scene == "Scene 19"
+        assert debugger.goto(session.events_in_range[19].metadata.timestamp)["current_scene"] == "Scene 19"
+
+    def test_what_if_with_list_mutations(self, debugger_setup):
+        """Test what-if callbacks that edit the events like a list."""
+        event_store, debugger = debugger_setup
+
+        start = datetime.utcnow() - timedelta(minutes=10)
+        for i in range(5):
+            event_store.append(
+                SceneSwitched(
+                    "obs_system",
+                    metadata=EventMetadata(timestamp=start + timedelta(seconds=i)),
+                    from_scene=f"Scene {i - 1}",
+                    to_scene=f"Scene {i}",
+                )
+            )
+
+        session = debugger.start_session()
+        debugger.step_forward(5)
+
+        def modify_events(events):
+            del events[0]
+            events.insert(0, SceneCreated(aggregate_id="scene:extra", scene_name="Extra"))
+            events.append(SceneSwitched("obs_system", from_scene="Scene 4", to_scene="Appended Scene"))
+            events[1:3] = events[1:3][::-1]
+            return events
+
+        state = debugger.what_if(modify_events)
+        assert state["current_scene"] == "Appended Scene"
+        assert state["event_count"] == 6
+        assert "Extra" in state["scenes"]
+
+        def truncate_copy(events):
+            copied = events.copy()
+            assert isinstance(copied, list) and len(copied) == 5
+            del copied[2:]
+            return copied
+
+        assert debugger.what_if(truncate_copy)["current_scene"] == "Scene 1"
+
+        # The session itself is untouched
+        assert [e.to_scene for e in session.events_in_range] == [f"Scene {i}" for i in range(5)]
+
     def test_find_event_pattern(self, debugger_setup):
         """Test finding event patterns."""
         event_store, debugger = debugger_setup
@@ -578,6 +809,18 @@ class TestTimeTravelDebugger:
         assert matches[0][0].scene_name == "Scene 1"
         assert matches[1][0].scene_name == "Scene 2"
 
+    def test_find_overlapping_event_pattern(self, debugger_setup):
+        """Test that overlapping pattern occurrences are all found."""
+        event_store, debugger = debugger_setup
+
+        for i in range(3):
+            event_store.append(SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}"))
+
+        debugger.start_session()
+        matches = debugger.find_event_pattern([EventType.SCENE_CREATED, EventType.SCENE_CREATED])
+
+        assert [[e.scene_name for e in match] for match in matches] == [["Scene 0", "Scene 1"], ["Scene 1", "Scene 2"]]
+
     def test_get_statistics(self, debugger_setup):
         """Test getting debug session statistics."""
         event_store, debugger = debugger_setup
@@ -638,6 +881,54 @@ class TestAsyncOperations:
             finally:
                 event_store.close()  # Close store before cleanup
 
+    async def test_write_behind_batches_persistence(self):
+        """Test buffered event persistence."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "test_events.db"
+            event_store = EventStore(db_path=db_path)
+            try:
+                event_store.start_write_behind(max_batch_size=100, max_flush_delay=60)
+
+                for i in range(5):
+                    event_store.append(SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}"))
+
+                # Indexed immediately, persisted on flush
+                assert len(event_store.replay_events()) == 5
+                assert event_store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
+
+                await event_store.stop_write_behind()
+                assert event_store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 5
+            finally:
+                event_store.close()
+
+            reloaded = EventStore(db_path=db_path)
+            try:
+                assert [e.scene_name for e in reloaded.replay_events()] == [f"Scene {i}" for i in range(5)]
+            finally:
+                reloaded.close()
+
+    async def test_failed_write_keeps_events_queued(self):
+        """Test that a failed batch write is retried instead of dropping events."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            event_store = EventStore(db_path=Path(tmpdir) / "test_events.db")
+            try:
+                event_store.start_write_behind(max_batch_size=3, max_flush_delay=60)
+
+                locked = sqlite3.OperationalError("database is locked")
+                with patch.object(event_store, "_transaction", side_effect=locked):
+                    for i in range(4):
+                        event_store.append(SceneCreated(aggregate_id=f"scene:{i}", scene_name=f"Scene {i}"))
+
+                # The full-batch writes failed, but every event is still queued
+                assert len(event_store.replay_events()) == 4
+                assert event_store._conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
+
+                await event_store.stop_write_behind()
+                rows = event_store._conn.execute("SELECT event_data FROM events ORDER BY rowid").fetchall()
+                assert [json.loads(row[0])["data"]["scene_name"] for row in rows] == [f"Scene {i}" for i in range(4)]
+            finally:
+                event_store.close()
+
     async def test_continuous_projection_updates(self):
         """Test continuous projection updates."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -657,6 +948,11 @@ class TestAsyncOperations:
                 projection = builder.get_projection("scenes")
                 assert "Dynamic Scene" in projection.state["scenes"]
 
+                # Each event is applied exactly once
+                event_store.append(SceneSwitched("obs_system", from_scene="Unknown", to_scene="Dynamic Scene"))
+                await asyncio.sleep(0.2)
+                assert projection.state["scene_switch_count"] == 1
+
                 # Stop updates
                 await builder.stop_continuous_update()
             finally: